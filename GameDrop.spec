@@ -19,7 +19,11 @@ a = Analysis(
         'PySide6.QtGui',
         'PySide6.QtWidgets',
         'PySide6.QtMultimedia',
-        'PySide6.QtMultimediaWidgets'
+        'PySide6.QtMultimediaWidgets',
+        # The window icon is an SVG: these pull in the qsvgicon (iconengines)
+        # and qsvg (imageformats) plugins, without which QIcon renders blank
+        'PySide6.QtSvg',
+        'PySide6.QtSvgWidgets'
     ],
     hookspath=[],
     hooksconfig={},
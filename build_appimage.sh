@@ -106,6 +106,15 @@ echo "--- Removing bundled PulseAudio libs to use host PipeWire-compatible versi
 find "$APPDIR/usr/bin" -name "libpulse*.so*" -delete
 find "$APPDIR/usr/bin" -name "libpulsecommon*.so*" -delete
 
+echo "--- Checking for the Qt SVG plugins ---"
+# Without these the SVG window icon is blank
+for SVG_PLUGIN in libqsvgicon.so libqsvg.so; do
+    if [ -z "$(find "$APPDIR/usr/bin" -path "*plugins/*" -name "$SVG_PLUGIN")" ]; then
+        echo "ERROR: Qt plugin '$SVG_PLUGIN' missing from the PyInstaller output"
+        exit 1
+    fi
+done
+
 # --- AppRun Script ---
 echo "--- Creating AppRun script ---"
 # This script is the entry point for the AppImage.
@@ -100,11 +100,32 @@ class GameDropController(QObject):
             logger.error(f"Error loading video: {str(e)}")
             self.status_updated.emit(f"Error loading video: {str(e)}", 0)
             return False
-    
-    def drop_video(self, start_time, end_time, output_path, webhooks=None, 
-                  max_size=10*1024*1024, clip_title=None, progress_callback=None, output_format="Original", discord_user=None, extra_quality=False):
+
+    def ensure_ffmpeg_available(self):
+        """
+        Make sure FFmpeg can be used before starting a clip job.
+        Shows an error dialog if it is missing, so this must be called
+        from the GUI thread.
+        Returns:
+            bool: True if FFmpeg is available, False otherwise
+        """
+        if not self.ffmpeg_available:
+            # On Linux, re-check in case the startup detection was a false negative
+            if is_linux():
+                self.ffmpeg_available = self._check_ffmpeg()
+            if not self.ffmpeg_available:
+                # If FFmpeg is still missing, show an error and abort
+                QMessageBox.critical(None, "Error", "FFmpeg is not available. Video clipping disabled.")
+                return False
+        return True
+
+    def drop_video(self, start_time, end_time, output_path, webhooks=None,
+                  max_size=10*1024*1024, clip_title=None, progress_callback=None, output_format="Original", discord_user=None, extra_quality=False,
+                  video_path=None, cancel_event=None):
         """
         Process (clip and compress) the selected video segment.
+        This runs on a worker thread, so it must not touch any widgets.
+        Call ensure_ffmpeg_available() from the GUI thread first.
         Args:
             start_time (float): Start time in seconds
             end_time (float): End time in seconds
@@ -113,22 +134,19 @@ class GameDropController(QObject):
             max_size (int): Max file size in bytes (default 10MB, Discord's current limit)
             clip_title (str): Custom clip name (optional)
             progress_callback (callable): Function to update progress bar (optional)
+            video_path (str): Source video (optional, defaults to the loaded video).
+                Pass it when the job may outlive the currently loaded video.
+            cancel_event (threading.Event): Set it to cancel the job (optional)
         Returns:
             dict: Result with 'success' and 'message' keys
         """
         if not self.ffmpeg_available:
-            # On Linux, re-check in case the startup detection was a false negative
-            if is_linux():
-                self.ffmpeg_available = self._check_ffmpeg()
-            if not self.ffmpeg_available:
-                # If FFmpeg is still missing, show an error and abort
-                QMessageBox.critical(None, "Error", "FFmpeg is not available. Video clipping disabled.")
-                return False
-        
+            return {"success": False, "message": "FFmpeg is not available. Video clipping disabled."}
+
         try:
             # Call the video processor to create the clip
             result = self.video_processor.compress_clip(
-                self.video_path, 
+                video_path or self.video_path, 
                 start_time, 
                 end_time, 
                 output_path, 
@@ -138,7 +156,8 @@ class GameDropController(QObject):
                 progress_callback,
                 output_format,
                 discord_user,
-                extra_quality
+                extra_quality,
+                cancel_event=cancel_event
             )
             
             if result["success"]:
@@ -160,13 +179,13 @@ class GameDropController(QObject):
         """
         self.media_controller.toggle_play_pause()
     
-    def seek_to_percentage(self, percentage):
+    def seek_to_position(self, position):
         """
-        Seek to a position in the video by percentage (0-100).
+        Seek to a position in the video.
         Args:
-            percentage (float): Percentage of the video duration
+            position (int): Position in milliseconds
         """
-        self.media_controller.seek_percentage(percentage)
+        self.media_controller.seek_position(position)
     
     def _check_ffmpeg(self):
         """
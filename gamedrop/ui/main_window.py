@@ -7,6 +7,8 @@ import sys
 import os
 import logging
 import json
+import threading
+from functools import partial
 from pathlib import Path
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
@@ -14,14 +16,14 @@ from PySide6.QtWidgets import (
     QSizePolicy, QComboBox, QLineEdit, QDialog, QFrame,
     QSpacerItem, QApplication
 )
-from PySide6.QtCore import Qt, QTimer, QUrl, Signal, Slot, QSize, QRectF, QPoint, QMimeData, QEvent, QThread
-from PySide6.QtGui import QIcon, QPixmap, QPainter, QColor, QMouseEvent, QDragEnterEvent, QDropEvent, QCursor, QDesktopServices
+from PySide6.QtCore import Qt, QTimer, QUrl, Signal, Slot, QSize, QPoint, QMimeData, QEvent, QThread, QObject, QRunnable, QThreadPool, QSignalBlocker, QElapsedTimer
+from PySide6.QtGui import QIcon, QPainter, QColor, QMouseEvent, QDragEnterEvent, QDropEvent, QCursor, QDesktopServices
 from PySide6.QtSvg import QSvgRenderer
 from PySide6.QtSvgWidgets import QSvgWidget
+from PySide6.QtMultimedia import QMediaPlayer
 from PySide6.QtMultimediaWidgets import QVideoWidget
 
 from gamedrop.ui.range_slider import RangeSlider
-from gamedrop.ui.dialogs import WebhookDialog, LogViewerDialog, FFmpegDownloadDialog
 from gamedrop.utils.ffmpeg_wrapper import download_ffmpeg
 from gamedrop.utils.paths import resource_path, get_logs_directory, get_webhooks_path
 from gamedrop.platform_utils import is_windows, is_linux, is_steam_deck
@@ -35,6 +37,11 @@ logger = logging.getLogger("GameDrop.MainWindow")
 # Constants
 WEBHOOKS_FILE = get_webhooks_path()
 
+# Media player enums compared in the playback state/status handlers
+_STATE_PLAYING = QMediaPlayer.PlaybackState.PlayingState
+_STATUS_LOADED = QMediaPlayer.MediaStatus.LoadedMedia
+_STATUS_INVALID = QMediaPlayer.MediaStatus.InvalidMedia
+
 
 class DropZone(QLabel):
     """
@@ -419,6 +426,38 @@ class DiscordAuthThread(QThread):
         self.auth_finished.emit(success)
 
 
+class DropWorkerSignals(QObject):
+    """Signals for DropWorker (QRunnable cannot define signals itself)."""
+    progress = Signal(int)
+    finished = Signal(dict)
+
+
+class DropWorker(QRunnable):
+    """Runs the controller's clip/compress/upload job on the global thread pool."""
+
+    def __init__(self, controller, **kwargs):
+        super().__init__()
+        self.controller = controller
+        self.kwargs = kwargs
+        self.signals = DropWorkerSignals()
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        """Ask the running job to stop; finished is still emitted (with 'cancelled' set)."""
+        self.cancel_event.set()
+
+    def run(self):
+        try:
+            # Progress is reported through a signal so the progress bar is
+            # only ever touched from the GUI thread
+            result = self.controller.drop_video(progress_callback=self.signals.progress.emit,
+                                                cancel_event=self.cancel_event, **self.kwargs)
+        except Exception as e:
+            logger.error(f"Error in drop worker: {str(e)}")
+            result = {"success": False, "message": str(e)}
+        self.signals.finished.emit(result or {"success": False})
+
+
 class MainWindow(QWidget):
     """
     Main application window for Game Drop with video playback and clipping controls.
@@ -428,14 +467,20 @@ class MainWindow(QWidget):
     def __init__(self, controller):
         super().__init__()
         self.controller = controller
-        self.logger = logging.getLogger("GameDrop.MainWindow")
         
         # Initialize UI variables
         self.video_path = None
+        self._video_parent = None  # Path of the folder containing video_path
+        self._video_stem = None    # video_path file name without extension
         self.video_duration = 0  # in milliseconds
+        self._seek_jump_ms = 0   # 1% of video_duration, see set_slider_value
+        self._time_suffix_template = " / 00:00:00 (Duration: %.1fs)"
+        self._last_range_text = None  # time_label text last set by update_range
         self.max_clip_duration = 30000  # 30 seconds in milliseconds
         self.is_media_loaded = False
         self.enforce_duration_limit = False
+        self._cached_filesize = None  # get_selected_filesize result, cleared on combo/input change
+        self._drop_worker = None  # Running DropWorker; Drop stays disabled until it finishes
         self.detected_gpu = self.controller.video_processor.gpu.gpu_type
         self.discord_oauth = DiscordOAuth()
         
@@ -453,6 +498,15 @@ class MainWindow(QWidget):
         self.setMouseTracking(True)
         self._resize_margin = 12  # Pixels from edge to trigger resize (increased for usability)
         
+        # Throttle state for update_progress
+        self._progress_timer = QElapsedTimer()
+        self._progress_timer.start()
+        self._last_progress_pct = -1
+        
+        # Throttle state for set_slider_value
+        self._slider_update_timer = QElapsedTimer()
+        self._slider_update_timer.start()
+        
         self.init_ui()
         self.apply_styles()
         
@@ -609,6 +663,8 @@ class MainWindow(QWidget):
         self.range_slider.setMinimumHeight(32)
         self.range_slider.rangeChanged.connect(self.update_range)
         self.range_slider.valueClicked.connect(self.seek_to_time)
+        # Drag seeks go straight to the controller, skipping the signal hop
+        self.range_slider.set_seek_function(self.controller.seek_to_position)
         timeline_layout.addWidget(self.range_slider)
         
         # Legacy time label (hidden but kept for compatibility)
@@ -657,9 +713,14 @@ class MainWindow(QWidget):
         filesize_row.addWidget(filesize_label)
         
         self.filesize_combo = QComboBox()
-        self.filesize_combo.addItems(["10 MB", "25 MB", "50 MB", "100 MB", "500 MB", "Custom..."])
+        # Each preset carries its size in bytes; "Custom..." has no data and is parsed from the input
+        for size_mb in (10, 25, 50, 100, 500):
+            self.filesize_combo.addItem(f"{size_mb} MB", size_mb * 1024 * 1024)
+        self.filesize_combo.addItem("Custom...", None)
         self.filesize_combo.setCurrentIndex(0)
         self.filesize_combo.setEnabled(False)
+        # Invalidate the cached size before handle_filesize_option reads it
+        self.filesize_combo.currentIndexChanged.connect(self._invalidate_filesize_cache)
         self.filesize_combo.currentIndexChanged.connect(self.handle_filesize_option)
         filesize_row.addWidget(self.filesize_combo, 1)
         
@@ -679,6 +740,7 @@ class MainWindow(QWidget):
         self.custom_filesize_input.setPlaceholderText("e.g., 10")
         self.custom_filesize_input.setEnabled(False)
         custom_filesize_layout.addWidget(self.custom_filesize_input, 1)
+        self.custom_filesize_input.textChanged.connect(self._invalidate_filesize_cache)
         self.custom_filesize_input.textChanged.connect(lambda: self.handle_filesize_option(self.filesize_combo.currentIndex()))
         
         self.custom_filesize_container.setVisible(False)
@@ -781,7 +843,16 @@ class MainWindow(QWidget):
         self.progress_bar = QProgressBar()
         self.progress_bar.setTextVisible(True)
         self.progress_bar.hide()
-        content_layout.addWidget(self.progress_bar)
+        
+        # Cancel button for a running drop, shown next to the progress bar
+        self.cancel_drop_button = QPushButton('Cancel')
+        self.cancel_drop_button.clicked.connect(self.cancel_drop)
+        self.cancel_drop_button.hide()
+        
+        progress_layout = QHBoxLayout()
+        progress_layout.addWidget(self.progress_bar, 1)
+        progress_layout.addWidget(self.cancel_drop_button)
+        content_layout.addLayout(progress_layout)
         
         main_layout.addWidget(content_widget, 1)
         
@@ -830,20 +901,13 @@ class MainWindow(QWidget):
         
     def set_window_icon(self):
         """Set the window icon from SVG"""
-        icon_size = 32
         svg_path = resource_path('assets/logo.svg')
-        renderer = QSvgRenderer(svg_path)
-        
-        if renderer.isValid():
-            renderer.setAspectRatioMode(Qt.KeepAspectRatio)
-            icon_pixmap = QPixmap(icon_size, icon_size)
-            icon_pixmap.fill(Qt.transparent)
-            painter = QPainter(icon_pixmap)
-            renderer.render(painter, QRectF(icon_pixmap.rect()))
-            painter.end()
-            self.setWindowIcon(QIcon(icon_pixmap))
-        else:
-            self.setWindowIcon(QIcon(svg_path))
+        # Qt's SVG icon engine rasterizes and caches each requested size itself,
+        # which keeps the icon sharp on HiDPI screens
+        icon = QIcon()
+        for icon_size in (16, 32, 64):
+            icon.addFile(svg_path, QSize(icon_size, icon_size))
+        self.setWindowIcon(icon)
 
     def paintEvent(self, event):
         """Ensure the entire window is painted with a solid background.
@@ -860,7 +924,7 @@ class MainWindow(QWidget):
             with open(qss_path, 'r') as f:
                 self.setStyleSheet(f.read())
         except FileNotFoundError:
-            self.logger.warning(f"Could not find styles.qss at {qss_path}, using fallback styles")
+            logger.warning(f"Could not find styles.qss at {qss_path}, using fallback styles")
             self.apply_fallback_styles()
             
     def apply_fallback_styles(self):
@@ -907,17 +971,17 @@ class MainWindow(QWidget):
         """Updates status message with optional timeout"""
         try:
             self.status_label.setText(f"Status: {message}")
-            self.logger.info(f"Status update: {message}")
+            logger.info(f"Status update: {message}")
             
             if timeout > 0:
                 QTimer.singleShot(timeout, lambda: self.status_label.setText("Status: Ready"))
         except Exception as e:
-            self.logger.error(f"Error updating status: {str(e)}")
+            logger.error(f"Error updating status: {str(e)}")
 
     def load_video(self):
         """Open file dialog to load a video file"""
         try:
-            self.logger.info("Opening file dialog to load video")
+            logger.info("Opening file dialog to load video")
             options = QFileDialog.Options()
             options |= QFileDialog.ReadOnly
             file_path, _ = QFileDialog.getOpenFileName(
@@ -929,46 +993,59 @@ class MainWindow(QWidget):
             )
             
             if not file_path:
-                self.logger.info("User cancelled video selection")
+                logger.info("User cancelled video selection")
                 return
                 
-            self.video_path = file_path
+            self._set_video_path(file_path)
             self.controller.load_video(file_path)
             
-            self.range_slider.lower_value = 0
-            self.range_slider.upper_value = 100
-            self.range_slider.update()
+            self._reset_range_slider()
             
         except Exception as e:
-            self.logger.error(f"Error loading video: {str(e)}")
+            logger.error(f"Error loading video: {str(e)}")
             QMessageBox.critical(self, "Error", f"Error loading video: {str(e)}")
 
+    def _reset_range_slider(self, upper=None):
+        """Move the range handles back to the start and upper (default: the end) without emitting signals"""
+        with QSignalBlocker(self.range_slider):
+            self.range_slider.lower_value = 0
+            self.range_slider.upper_value = self.range_slider.maximum() if upper is None else upper
+            self.range_slider.update()
+
+    def _set_video_path(self, file_path):
+        """Store the loaded video path and the parts drop_video needs for the output name"""
+        self.video_path = file_path
+        self._last_range_text = None  # Make update_range refresh the labels for the new video
+        path = Path(file_path)
+        self._video_parent = path.parent
+        self._video_stem = path.stem
+
     def drop_video(self):
         """Process the selected video clip"""
         if not self.video_path:
             return
-            
+        if not self.controller.ensure_ffmpeg_available():
+            return
+
         try:
-            start_time = round((self.range_slider.lower_value / 100) * (self.video_duration / 1000), 3)
-            end_time = round((self.range_slider.upper_value / 100) * (self.video_duration / 1000), 3)
+            start_time = self.range_slider.lower_value / 1000
+            end_time = self.range_slider.upper_value / 1000
             duration = round(end_time - start_time, 3)
             
             if self.enforce_duration_limit and abs(duration - 30) > 0.001:
                 end_time = start_time + 30
                 duration = 30.0
             
-            input_dir = os.path.dirname(self.video_path)
-            input_filename = os.path.splitext(os.path.basename(self.video_path))[0]
             
             custom_name = ""
             if not self.enforce_duration_limit or self.clip_name_input.text().strip():
                 custom_name = self.clip_name_input.text().strip()
                 
-            output_filename = f"{custom_name if custom_name else input_filename}_clip.mp4"
-            output_path = os.path.normpath(os.path.join(input_dir, output_filename))
+            output_path = str(self._video_parent / f"{custom_name or self._video_stem}_clip.mp4")
             
             self.progress_bar.setRange(0, 100)
             self.progress_bar.setValue(0)
+            self._last_progress_pct = 0
             self.progress_bar.show()
             
             enabled_webhooks = self.get_enabled_webhooks()
@@ -984,7 +1061,7 @@ class MainWindow(QWidget):
             # Pre-flight check for Discord limit
             if max_size > 10 * 1024 * 1024 and enabled_webhooks:
                 # Disable webhooks for this drop since user explicitly asked for > 10MB
-                self.logger.info(f"Target size {max_size} > 10MB, disabling webhooks for this drop.")
+                logger.info(f"Target size {max_size} > 10MB, disabling webhooks for this drop.")
                 enabled_webhooks = [] 
                 
                 # Visual feedback is handled by handle_filesize_option, but we double check here
@@ -994,19 +1071,56 @@ class MainWindow(QWidget):
             discord_user = self.discord_oauth.get_cached_user() if self.discord_oauth.is_authenticated() else None
             extra_quality = self.extra_quality_checkbox.isChecked()
             
-            result = self.controller.drop_video(
-                start_time, 
-                end_time, 
-                output_path, 
-                enabled_webhooks, 
-                max_size, 
-                custom_name, 
-                self.update_progress,
-                output_format,
-                discord_user,
-                extra_quality
+            # FFmpeg/IO work runs on the thread pool so the event loop stays responsive.
+            # The job gets its own copy of the video path and the finished slot its own
+            # context, so loading another video meanwhile can't change either.
+            worker = DropWorker(
+                self.controller,
+                video_path=self.video_path,
+                start_time=start_time,
+                end_time=end_time,
+                output_path=output_path,
+                webhooks=enabled_webhooks,
+                max_size=max_size,
+                clip_title=custom_name,
+                output_format=output_format,
+                discord_user=discord_user,
+                extra_quality=extra_quality
             )
+            worker.signals.progress.connect(self.update_progress)
+            worker.signals.finished.connect(partial(self._on_drop_finished, output_path=output_path,
+                                                    enabled_webhooks=enabled_webhooks, max_size=max_size))
+            self._drop_worker = worker
+            self.drop_button.setEnabled(False)
+            self.cancel_drop_button.setEnabled(True)
+            self.cancel_drop_button.show()
+            QThreadPool.globalInstance().start(worker)
             
+        except Exception as e:
+            logger.error(f"Error dropping video: {str(e)}")
+            QMessageBox.critical(self, "Error", f"Error dropping video: {str(e)}")
+            self.progress_bar.hide()
+            self.drop_button.setEnabled(True)
+
+    def cancel_drop(self):
+        """Stop the running drop; _on_drop_finished reports it once FFmpeg has exited"""
+        if self._drop_worker is not None:
+            self._drop_worker.cancel()
+            self.cancel_drop_button.setEnabled(False)
+            self.update_status("Cancelling...")
+
+    def _on_drop_finished(self, result, output_path, enabled_webhooks, max_size):
+        """Report the outcome of a DropWorker job started for output_path"""
+        self._drop_worker = None
+        self.drop_button.setEnabled(self.is_media_loaded)
+        self.cancel_drop_button.hide()
+        
+        if result and result.get("cancelled"):
+            self.progress_bar.hide()
+            self.update_status("Drop cancelled", 5000)
+            return
+        
+        try:
             # Warn if webhooks were requested but size limit prevented it (Backend check backup)
             # This logic might need adjustment if we stripped webhooks beforehand
             if result and result.get("success"):
@@ -1042,21 +1156,22 @@ class MainWindow(QWidget):
                           QMessageBox.information(self, "Clip Created", file_message)
             
         except Exception as e:
-            self.logger.error(f"Error dropping video: {str(e)}")
+            logger.error(f"Error dropping video: {str(e)}")
             QMessageBox.critical(self, "Error", f"Error dropping video: {str(e)}")
             self.progress_bar.hide()
 
     def get_enabled_webhooks(self):
         """Get list of enabled Discord webhook URLs"""
         enabled_webhooks = []
-        if os.path.exists(WEBHOOKS_FILE):
-            try:
-                with open(WEBHOOKS_FILE, 'r') as f:
-                    webhooks = json.load(f)
-                    enabled_webhooks = [data['url'] for data in webhooks.values() 
-                                       if data.get('checked', False)]
-            except Exception as e:
-                self.logger.error(f"Error loading webhooks: {str(e)}")
+        try:
+            with open(WEBHOOKS_FILE, 'rb') as f:
+                webhooks = json.load(f)
+                enabled_webhooks = [data['url'] for data in webhooks.values() 
+                                   if data.get('checked', False)]
+        except FileNotFoundError:
+            pass  # No webhooks configured yet
+        except Exception as e:
+            logger.error(f"Error loading webhooks: {str(e)}")
         return enabled_webhooks
 
     def toggle_play_pause(self):
@@ -1068,13 +1183,24 @@ class MainWindow(QWidget):
 
     def show_webhook_dialog(self):
         """Show the webhook management dialog"""
+        # Dialogs are imported on first use to keep them off the startup path
+        from gamedrop.ui.dialogs import WebhookDialog
         dialog = WebhookDialog(self)
         dialog.exec()
 
     def update_progress(self, progress):
         """Update progress bar with current progress"""
-        self.progress_bar.setValue(int(progress))
-        if progress >= 100:
+        pct = int(progress)
+        # Skip repaints for an unchanged percentage, and rate-limit intermediate
+        # values to one every 50 ms (start/end values always go through)
+        if pct == self._last_progress_pct:
+            return
+        if 0 < pct < 100 and self._progress_timer.elapsed() < 50:
+            return
+        self._last_progress_pct = pct
+        self._progress_timer.restart()
+        self.progress_bar.setValue(pct)
+        if pct >= 100:
             self.progress_bar.hide()
     
     def _video_clicked(self, event):
@@ -1084,12 +1210,10 @@ class MainWindow(QWidget):
     
     def _on_file_dropped(self, file_path: str):
         """Handle file dropped from the DropZone widget"""
-        self.logger.info(f"File dropped via DropZone: {file_path}")
-        self.video_path = file_path
+        logger.info(f"File dropped via DropZone: {file_path}")
+        self._set_video_path(file_path)
         self.controller.load_video(file_path)
-        self.range_slider.lower_value = 0
-        self.range_slider.upper_value = 100
-        self.range_slider.update()
+        self._reset_range_slider()
 
     def update_discord_btn_state(self):
         if self.discord_oauth.is_authenticated():
@@ -1146,9 +1270,8 @@ class MainWindow(QWidget):
         """Handle changes in playback position"""
         if self.video_duration > 0:
             current_time = self.controller.media_controller.format_time(position)
-            total_time = self.controller.media_controller.format_time(self.video_duration)
-            clip_duration = (self.range_slider.upper_value - self.range_slider.lower_value) / 100 * (self.video_duration / 1000)
-            self.time_label.setText(f"{current_time} / {total_time} (Duration: {clip_duration:.1f}s)")
+            clip_duration = (self.range_slider.upper_value - self.range_slider.lower_value) / 1000
+            self.time_label.setText(current_time + self._time_suffix_template % clip_duration)
             self.set_slider_value(position)
 
     def duration_changed(self, duration):
@@ -1157,30 +1280,30 @@ class MainWindow(QWidget):
             return
             
         self.video_duration = duration
+        self._seek_jump_ms = duration / 100
         
         # Update time labels
         total_time = self.controller.media_controller.format_time(duration)
+        # Prebuilt label suffix so position_changed only formats the clip duration
+        self._time_suffix_template = f" / {total_time} (Duration: %.1fs)"
         self.end_time_label.setText(total_time)
         self.start_time_label.setText("00:00:00")
         
+        # The slider works in milliseconds, so its range is the video duration
+        self.range_slider.set_duration(duration)
+        self.range_slider.set_constraints(self.enforce_duration_limit, duration, self.max_clip_duration)
+        upper = duration
         if self.enforce_duration_limit:
-            thirty_seconds_percent = (30000 / float(duration)) * 100
-            self.range_slider.lower_value = 0
-            self.range_slider.upper_value = min(100, int(thirty_seconds_percent + 0.5))
-        else:
-            self.range_slider.lower_value = 0
-            self.range_slider.upper_value = 100
-            
-        self.range_slider.update()
+            upper = min(duration, self.max_clip_duration)
+        self._reset_range_slider(upper)
         self.update_range(self.range_slider.lower_value, self.range_slider.upper_value)
         
         self.play_pause_button.setEnabled(True)
-        self.drop_button.setEnabled(True)
+        self.drop_button.setEnabled(self._drop_worker is None)
 
     def media_state_changed(self, state):
         """Handle media state changes (playing/paused/stopped)"""
-        from PySide6.QtMultimedia import QMediaPlayer
-        if state == QMediaPlayer.PlaybackState.PlayingState:
+        if state == _STATE_PLAYING:
             self.play_pause_button.setText("Pause")
             self.play_overlay_btn.setText("⏸")
         else:
@@ -1189,17 +1312,15 @@ class MainWindow(QWidget):
 
     def media_status_changed(self, status):
         """Handle media status changes"""
-        from PySide6.QtMultimedia import QMediaPlayer
-        
-        if status == QMediaPlayer.MediaStatus.LoadedMedia:
+        if status == _STATUS_LOADED:
             self.is_media_loaded = True
             self.play_pause_button.setEnabled(True)
-            self.drop_button.setEnabled(True)
+            self.drop_button.setEnabled(self._drop_worker is None)
             self.play_overlay_btn.show()  # Show play button now that video is loaded
             self.drop_zone.set_overlay_mode(True)  # Switch drop zone to overlay mode
             self.update_status("Video loaded successfully")
             
-        elif status == QMediaPlayer.MediaStatus.InvalidMedia:
+        elif status == _STATUS_INVALID:
             self.is_media_loaded = False
             self.play_pause_button.setEnabled(False)
             self.drop_button.setEnabled(False)
@@ -1209,44 +1330,58 @@ class MainWindow(QWidget):
 
     def handle_error(self, error_str):
         """Handle media player errors"""
-        self.logger.error(f"Media player error: {error_str}")
+        logger.error(f"Media player error: {error_str}")
         self.update_status(f"Error: {error_str}")
         QMessageBox.critical(self, "Media Error", f"An error occurred: {error_str}")
 
     def update_range(self, lower, upper):
         """Handle range slider value changes"""
         if self.video_duration > 0:
-            if self.enforce_duration_limit:
-                duration_ms = round((upper - lower) / 100 * self.video_duration)
-                
-                if duration_ms > self.max_clip_duration:
-                    new_upper = lower + round((self.max_clip_duration / self.video_duration) * 100, 3)
-                    self.range_slider.upper_value = min(100, new_upper)
-                    upper = self.range_slider.upper_value
-                    self.range_slider.update()
+            if self.enforce_duration_limit and upper - lower > self.max_clip_duration:
+                old_upper = self.range_slider.upper_value
+                upper = min(self.video_duration, lower + self.max_clip_duration)
+                self.range_slider.upper_value = upper
+                self.range_slider.update_handles(self.range_slider.lower_value, old_upper)
             
-            start_time = round(lower / 100 * self.video_duration)
-            end_time = round(upper / 100 * self.video_duration)
+            start_time = lower
+            end_time = upper
             
             # Update time labels
             start_str = self.controller.media_controller.format_time(start_time)
             end_str = self.controller.media_controller.format_time(end_time)
             clip_duration = (end_time - start_time) / 1000
+            range_text = f"{start_str} / {end_str} (Duration: {clip_duration:.3f}s)"
+            
+            # Skip the setText calls (and relayout) when nothing shown has changed;
+            # range_text contains both clip labels, so comparing it is enough
+            if range_text == self._last_range_text:
+                return
+            self._last_range_text = range_text
             
             self.clip_start_label.setText(start_str)
             self.clip_end_label.setText(end_str)
-            self.time_label.setText(f"{start_str} / {end_str} (Duration: {clip_duration:.3f}s)")
+            self.time_label.setText(range_text)
 
     def seek_to_time(self, value):
-        """Seek to a specific time in the video by percentage"""
-        self.controller.seek_to_percentage(value)
+        """Seek to a specific time in the video (ms)"""
+        self.controller.seek_to_position(value)
 
     def set_slider_value(self, position):
         """Update the slider value to match the current playback position"""
         if self.video_duration <= 0:
             return
-        value = int((position / self.video_duration) * 100)
-        self.range_slider.setValue(value)
+        current = self.range_slider.value()
+        if position == current:
+            return
+        # Playback reports positions at >30 Hz; only move the slider every 100 ms
+        # unless the position jumped by at least 1% of the video (e.g. a seek)
+        if (self._slider_update_timer.elapsed() < 100
+                and abs(position - current) < self._seek_jump_ms):
+            return
+        self._slider_update_timer.restart()
+        # Playback drives the slider here, so don't let it emit valueChanged back
+        with QSignalBlocker(self.range_slider):
+            self.range_slider.setValue(position)
 
     def toggle_duration_limit(self, state):
         """Handle duration limit checkbox state change"""
@@ -1255,6 +1390,7 @@ class MainWindow(QWidget):
             self.duration_warning_label.setVisible(not self.enforce_duration_limit)
         if hasattr(self, 'filesize_combo'):
             self.filesize_combo.setEnabled(not self.enforce_duration_limit)
+        self.range_slider.set_constraints(self.enforce_duration_limit, self.video_duration, self.max_clip_duration)
 
         if self.enforce_duration_limit:
             self.custom_filesize_input.setEnabled(False)
@@ -1266,12 +1402,12 @@ class MainWindow(QWidget):
         
         if self.video_duration > 0:
             if self.enforce_duration_limit:
-                current_duration = (self.range_slider.upper_value - self.range_slider.lower_value) / 100 * self.video_duration
+                current_duration = self.range_slider.upper_value - self.range_slider.lower_value
                 if current_duration > self.max_clip_duration:
-                    new_upper = self.range_slider.lower_value + (self.max_clip_duration / self.video_duration * 100)
-                    self.range_slider.upper_value = min(100, int(new_upper))
-                    self.range_slider.update()
-                    self.range_slider.update()
+                    old_upper = self.range_slider.upper_value
+                    new_upper = self.range_slider.lower_value + self.max_clip_duration
+                    self.range_slider.upper_value = min(self.video_duration, new_upper)
+                    self.range_slider.update_handles(self.range_slider.lower_value, old_upper)
             self.update_range(self.range_slider.lower_value, self.range_slider.upper_value)
             
         self._update_discord_limit_ui()
@@ -1309,38 +1445,39 @@ class MainWindow(QWidget):
         
         self._update_discord_limit_ui()
 
+    def _invalidate_filesize_cache(self, *args):
+        """Forget the cached file size so the next lookup re-reads the widgets"""
+        self._cached_filesize = None
+
     def get_selected_filesize(self):
-        """Get the selected file size limit in bytes"""
-        index = self.filesize_combo.currentIndex()
-        if index == 0:
-            return 10 * 1024 * 1024
-        elif index == 1:
-            return 25 * 1024 * 1024
-        elif index == 2:
-            return 50 * 1024 * 1024
-        elif index == 3:
-            return 100 * 1024 * 1024
-        elif index == 4:
-            return 500 * 1024 * 1024
-        elif index == 5:
-            try:
-                text = self.custom_filesize_input.text().strip()
-                if not text:
-                    return 10 * 1024 * 1024
-                custom_mb = float(text)
-                if custom_mb <= 0:
-                    return 10 * 1024 * 1024
-                return int(custom_mb * 1024 * 1024)
-            except ValueError:
-                return 10 * 1024 * 1024
+        """Get the selected file size limit in bytes (cached until the combo or input changes)"""
+        if self._cached_filesize is None:
+            self._cached_filesize = self._compute_selected_filesize()
+        return self._cached_filesize
+
+    def _compute_selected_filesize(self):
+        """Read the file size limit in bytes from the combo box or custom input"""
+        size_bytes = self.filesize_combo.currentData()
+        if size_bytes is not None:
+            return size_bytes
         
-        return 10 * 1024 * 1024
+        # Custom size
+        try:
+            text = self.custom_filesize_input.text().strip()
+            if not text:
+                return 10 * 1024 * 1024
+            custom_mb = float(text)
+            if custom_mb <= 0:
+                return 10 * 1024 * 1024
+            return int(custom_mb * 1024 * 1024)
+        except ValueError:
+            return 10 * 1024 * 1024
 
     def view_logs(self):
         """Open the log file for viewing"""
         try:
             log_path = os.path.join(get_logs_directory(), 'game_drop_debug.log')
-            self.logger.info(f"Opening log file: {log_path}")
+            logger.info(f"Opening log file: {log_path}")
             
             system_info = f"GameDrop v{VERSION}\n"
             system_info += f"Python: {sys.version}\n"
@@ -1348,11 +1485,12 @@ class MainWindow(QWidget):
             system_info += f"GPU Encoder: {self.detected_gpu}\n"
             system_info += "-" * 80 + "\n\n"
             
+            from gamedrop.ui.dialogs import LogViewerDialog
             dialog = LogViewerDialog(self, log_path, system_info)
             dialog.exec()
             
         except Exception as e:
-            self.logger.error(f"Error viewing logs: {str(e)}")
+            logger.error(f"Error viewing logs: {str(e)}")
             QMessageBox.critical(self, "Error", f"Could not open log file: {str(e)}")
 
     def show_ffmpeg_download_dialog(self):
@@ -1366,9 +1504,10 @@ class MainWindow(QWidget):
                 self.controller.ffmpeg_available = True
                 return True
             except Exception as e:
-                self.logger.error(f"Error downloading FFmpeg: {str(e)}")
+                logger.error(f"Error downloading FFmpeg: {str(e)}")
                 return False
         
+        from gamedrop.ui.dialogs import FFmpegDownloadDialog
         dialog = FFmpegDownloadDialog(self, download_ffmpeg_callback)
         result = dialog.exec()
         
@@ -1416,24 +1555,24 @@ class MainWindow(QWidget):
         """Handle drag enter events for video file drops"""
         mime_data = event.mimeData()
         formats = mime_data.formats()
-        self.logger.debug(f"Drag enter event. Formats: {formats}")
+        logger.debug(f"Drag enter event. Formats: {formats}")
         
         if mime_data.hasUrls():
-            self.logger.debug(f"URLs found: {[u.toString() for u in mime_data.urls()]}")
+            logger.debug(f"URLs found: {[u.toString() for u in mime_data.urls()]}")
             for url in mime_data.urls():
                 file_path = url.toLocalFile()
                 # Fallback: sometimes toLocalFile() is empty on Wayland/Qt6 for some paths
                 if not file_path and url.scheme() == 'file':
                     file_path = url.path()
                 
-                self.logger.debug(f"Checking file candidate: {file_path}")
+                logger.debug(f"Checking file candidate: {file_path}")
                 if file_path and file_path.lower().endswith(('.mp4', '.avi', '.mkv', '.mov', '.webm', '.wmv')):
                     event.acceptProposedAction()
                     return
         
         # Fallback check
         elif mime_data.hasFormat('text/uri-list'):
-            self.logger.debug("Format text/uri-list detected (potential file drop)")
+            logger.debug("Format text/uri-list detected (potential file drop)")
             event.acceptProposedAction()
             return
             
@@ -1445,7 +1584,7 @@ class MainWindow(QWidget):
         should_accept = event.mimeData().hasUrls() or event.mimeData().hasFormat('text/uri-list')
         
         # Uncomment to debug high-frequency move events (can be spammy)
-        # self.logger.debug(f"Drag move. Accept: {should_accept}")
+        # logger.debug(f"Drag move. Accept: {should_accept}")
         
         if should_accept:
             event.setDropAction(Qt.CopyAction)
@@ -1455,7 +1594,7 @@ class MainWindow(QWidget):
     
     def dropEvent(self, event: QDropEvent):
         """Handle drop events to load video files"""
-        self.logger.debug("Drop event received")
+        logger.debug("Drop event received")
         mime_data = event.mimeData()
         
         paths_to_check = []
@@ -1482,22 +1621,20 @@ class MainWindow(QWidget):
                     else:
                         paths_to_check.append(line)
             except Exception as e:
-                self.logger.error(f"Error parsing uri-list: {e}")
+                logger.error(f"Error parsing uri-list: {e}")
 
-        self.logger.info(f"Processing drop candidates: {paths_to_check}")
+        logger.info(f"Processing drop candidates: {paths_to_check}")
 
         for file_path in paths_to_check:
             if file_path and file_path.lower().endswith(('.mp4', '.avi', '.mkv', '.mov', '.webm', '.wmv')):
-                self.logger.info(f"Valid video file dropped: {file_path}")
-                self.video_path = file_path
+                logger.info(f"Valid video file dropped: {file_path}")
+                self._set_video_path(file_path)
                 self.controller.load_video(file_path)
-                self.range_slider.lower_value = 0
-                self.range_slider.upper_value = 100
-                self.range_slider.update()
+                self._reset_range_slider()
                 event.acceptProposedAction()
                 return
                 
-        self.logger.warning("Drop event ignored - no valid video files found in payload")
+        logger.warning("Drop event ignored - no valid video files found in payload")
         event.ignore()
 
     def eventFilter(self, watched, event):
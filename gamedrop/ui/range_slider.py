@@ -11,7 +11,7 @@ uses different colors for the start (blue) and end (orange) handles
 to make them easily distinguishable.
 """
 from PySide6.QtWidgets import QSlider
-from PySide6.QtCore import Qt, Signal, QRect
+from PySide6.QtCore import Qt, Signal, QRect, QTimer
 from PySide6.QtGui import QPainter, QColor
 
 
@@ -24,11 +24,11 @@ class RangeSlider(QSlider):
     - Highlighted region between handles
     - Click-to-seek functionality outside the handles
     - Automatic handle adjustment to maintain max duration when enabled
-    - Precise percentage-based calculations for accurate video positioning
+    - Integer millisecond positions, so no percentage conversions are needed
     
     Signals:
-    - rangeChanged(start, end): Emitted when either handle moves
-    - valueClicked(position): Emitted when clicking the timeline for seeking
+    - rangeChanged(start, end): Emitted when either handle moves (ms)
+    - valueClicked(position): Emitted when clicking the timeline for seeking (ms)
     """
 
     rangeChanged = Signal(int, int)
@@ -43,23 +43,113 @@ class RangeSlider(QSlider):
             parent: Parent widget (optional)
             
         The slider is initialized with:
-        - Range from 0 to 100 (representing video position percentage)
-        - Two handles at start (0%) and end (100%)
+        - A placeholder range of 0 to 100 until set_duration() is called
+          with the video length; after that all values are milliseconds
+        - Two handles at the start and end of the range
         - Tick marks below the slider for visual reference
         - Single-step increments for precise adjustments
         """
         super().__init__(orientation, parent)
-        # Initialize handle positions (as percentages)
-        self.lower_value = 0      # Start handle at 0%
-        self.upper_value = 100    # End handle at 100%
+        # Initialize handle positions (in milliseconds once a video is loaded)
+        self.lower_value = 0      # Start handle at the beginning
+        self.upper_value = 100    # End handle at the end of the placeholder range
         self.active_handle = None # Tracks which handle is being dragged
         
+        # Clip duration constraints, pushed in by the owner via set_constraints()
+        self._max_clip_ms = 30000        # Discord's 30-second limit
+        self._limit_active = False       # Enforced and a video is loaded; checked per drag move
+        
         # Configure slider behavior
-        self.setRange(0, 100)     # Set percentage range
+        self.setRange(0, 100)     # Placeholder range until a video is loaded
         self.setOrientation(orientation)
         self.setTickPosition(QSlider.TicksBelow)  # Show tick marks for visual reference
-        self.setTickInterval(10)  # Place tick marks every 10%
-        self.setSingleStep(1)     # Allow fine-grained 1% adjustments
+        self.setTickInterval(10)  # Place tick marks every 10% of the range
+        self.setSingleStep(1)     # Allow fine-grained 1ms adjustments
+        
+        # Colors used by paintEvent, created once instead of on every repaint
+        self._highlight_color = QColor(60, 110, 160, 100)    # Semi-transparent blue
+        self._lower_handle_color = QColor(135, 206, 235)     # Light blue
+        self._upper_handle_color = QColor(254, 180, 123)     # Light orange
+        self._handle_border_color = QColor(100, 100, 100)
+        
+        # Coalesce seeks while a handle is dragged: only the latest position is
+        # emitted once the mouse has been still for 40ms (or on release)
+        self._pending_seek = None
+        self._seek_fn = None  # Optional direct seek callable used for drag seeks
+        self._seek_timer = QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(40)
+        self._seek_timer.timeout.connect(self._flush_seek)
+
+    def set_duration(self, duration_ms):
+        """
+        Use the video duration (ms) as the slider range.
+        
+        Args:
+            duration_ms (int): Length of the loaded video in milliseconds
+        """
+        self.setRange(0, duration_ms)
+        self.setTickInterval(max(1, duration_ms // 10))  # Keep ticks every 10%
+
+    def set_constraints(self, enforce, duration_ms, max_ms):
+        """
+        Configure the clip duration limit applied while dragging the end handle.
+        
+        Args:
+            enforce (bool): Whether the maximum clip duration is enforced
+            duration_ms (int): Length of the loaded video in milliseconds
+            max_ms (int): Maximum clip duration in milliseconds
+        """
+        self._max_clip_ms = max_ms
+        self._limit_active = bool(enforce) and duration_ms > 0
+
+    def set_seek_function(self, func):
+        """
+        Seek directly through func while dragging instead of emitting valueClicked.
+        
+        Args:
+            func (callable): Called with the handle position in milliseconds,
+                or None to go back to emitting valueClicked
+        
+        Clicks on the timeline still emit valueClicked.
+        """
+        self._seek_fn = func
+
+    def update_handles(self, old_lower, old_upper):
+        """
+        Schedule a repaint of only the strips the handles moved across.
+        
+        Args:
+            old_lower (int): Previous start handle position (ms)
+            old_upper (int): Previous end handle position (ms)
+        
+        Each dirty strip spans the old and new pixel position of a handle plus
+        a margin for the handle width, so the rest of the slider (groove, tick
+        marks, unchanged part of the highlight) is not redrawn.
+        """
+        rect = self.rect()
+        scale = rect.width() / (self.maximum() or 1)
+        for old_value, new_value in ((old_lower, self.lower_value), (old_upper, self.upper_value)):
+            if old_value == new_value:
+                continue
+            old_px = int(old_value * scale)
+            new_px = int(new_value * scale)
+            self.update(QRect(min(old_px, new_px) - 12, rect.y(), abs(new_px - old_px) + 24, rect.height()))
+
+    def _queue_seek(self, value):
+        """Remember the latest drag position and (re)start the seek debounce timer."""
+        self._pending_seek = value
+        self._seek_timer.start()
+
+    def _flush_seek(self):
+        """Seek to the pending drag position, if any."""
+        if self._pending_seek is not None:
+            value = self._pending_seek
+            self._pending_seek = None
+            if self._seek_fn is not None:
+                self._seek_fn(value)
+            else:
+                self.valueClicked.emit(value)
 
     def paintEvent(self, event):
         """
@@ -77,44 +167,40 @@ class RangeSlider(QSlider):
         """
         super().paintEvent(event)
         painter = QPainter(self)
+        # Everything drawn here is an axis-aligned rect, so antialiasing only costs time
+        painter.setRenderHint(QPainter.Antialiasing, False)
         rect = self.rect()
         handle_width = 10  # Width of the handle in pixels
+        y = rect.y()
+        height = rect.height()
+        
+        # Convert both handle positions from ms to pixels once
+        scale = rect.width() / (self.maximum() or 1)
+        lower_px = int(self.lower_value * scale)
+        upper_px = int(self.upper_value * scale)
         
         # Draw the blue highlighted region between the handles
         # This shows the selected portion of the video
         highlight_rect = QRect(
-            int(self.lower_value / 100 * rect.width()),   # Convert percentage to pixels
-            rect.y() + 4,  # Offset from top for visual appeal
-            int((self.upper_value - self.lower_value) / 100 * rect.width()),  # Width based on handle positions
-            rect.height() - 8  # Slightly smaller than slider for visual appeal
+            lower_px,
+            y + 4,  # Offset from top for visual appeal
+            upper_px - lower_px,  # Width based on handle positions
+            height - 8  # Slightly smaller than slider for visual appeal
         )
-        painter.setBrush(QColor(60, 110, 160, 100))  # Semi-transparent blue
+        painter.setBrush(self._highlight_color)
         painter.setPen(Qt.NoPen)
         painter.drawRect(highlight_rect)
         
-        # Draw handles
-        lower_handle_rect = QRect(
-            int(self.lower_value / 100 * rect.width()) - handle_width // 2, 
-            rect.y(), 
-            handle_width, 
-            rect.height()
-        )
-        upper_handle_rect = QRect(
-            int(self.upper_value / 100 * rect.width()) - handle_width // 2, 
-            rect.y(), 
-            handle_width, 
-            rect.height()
-        )
+        # Draw handles (both share the same border pen)
+        painter.setPen(self._handle_border_color)
         
         # Draw lower handle
-        painter.setBrush(QColor(135, 206, 235))  # Light blue
-        painter.setPen(QColor(100, 100, 100))
-        painter.drawRect(lower_handle_rect)
+        painter.setBrush(self._lower_handle_color)
+        painter.drawRect(QRect(lower_px - handle_width // 2, y, handle_width, height))
         
         # Draw upper handle
-        painter.setBrush(QColor(254, 180, 123))  # Light orange
-        painter.setPen(QColor(100, 100, 100))
-        painter.drawRect(upper_handle_rect)
+        painter.setBrush(self._upper_handle_color)
+        painter.drawRect(QRect(upper_px - handle_width // 2, y, handle_width, height))
 
     def mousePressEvent(self, event):
         """
@@ -127,23 +213,29 @@ class RangeSlider(QSlider):
         The handle hitbox is intentionally larger than the visual handle
         to make it easier to grab and drag.
         """
-        pos = event.position()
-        rect = self.rect()
+        px = event.position().x()
+        width = self.width()
         handle_width = 10
+        maximum = self.maximum()
         
-        # Convert click position to a percentage (0-100)
-        value = max(0, min(100, int(pos.x() / rect.width() * 100)))
+        # Convert click position to a position in ms, clamped to the slider range
+        value = int(px / width * maximum)
+        if value < 0:
+            value = 0
+        elif value > maximum:
+            value = maximum
         
         # Calculate the pixel positions of both handles
-        lower_handle_x = int(self.lower_value / 100 * rect.width())
-        upper_handle_x = int(self.upper_value / 100 * rect.width())
+        lower_handle_x = int(self.lower_value / (maximum or 1) * width)
+        upper_handle_x = int(self.upper_value / (maximum or 1) * width)
         
-        # Create larger invisible regions around handles for easier interaction
-        lower_handle_rect = QRect(lower_handle_x - handle_width, rect.y(), handle_width * 2, rect.height())
-        upper_handle_rect = QRect(upper_handle_x - handle_width, rect.y(), handle_width * 2, rect.height())
+        # Use hit regions twice the handle width for easier interaction.
+        # The handles span the full slider height, so only x needs checking.
+        in_lower = lower_handle_x - handle_width <= px <= lower_handle_x + handle_width
+        in_upper = upper_handle_x - handle_width <= px <= upper_handle_x + handle_width
         
         # Determine if user clicked on a handle
-        if lower_handle_rect.contains(pos.toPoint()) or upper_handle_rect.contains(pos.toPoint()):
+        if in_lower or in_upper:
             # Select the closest handle to drag
             self.active_handle = 'lower' if abs(value - self.lower_value) <= abs(value - self.upper_value) else 'upper'
         else:
@@ -161,50 +253,60 @@ class RangeSlider(QSlider):
         3. Maintains proper ordering (start handle before end handle)
         4. Updates the video position to match the handle being dragged
         
-        The positions are calculated with high precision (3 decimal places)
-        to ensure accurate video clipping.
+        Positions are whole milliseconds, which is as precise as the
+        video clipping needs to be.
         """
-        if self.active_handle is None:
+        handle = self.active_handle
+        if handle is None:
             return
             
-        pos = event.position()
-        # Use 3 decimal places for more precise percentage calculation
-        value = max(0, min(100, round(pos.x() / self.rect().width() * 100, 3)))
-        
-        if self.active_handle == 'lower':
-            if value < self.upper_value:
-                self.lower_value = value
-                # Emit valueClicked to update playback position to the start handle position
-                self.valueClicked.emit(self.lower_value)
-        elif self.active_handle == 'upper':
-            if value > self.lower_value:
+        # Work on locals and write the handle positions back once at the end
+        maximum = self.maximum()
+        value = int(event.position().x() / self.width() * maximum)
+        # Dragging can go past either end of the slider, so clamp to the range
+        if value < 0:
+            value = 0
+        elif value > maximum:
+            value = maximum
+        old_lower = lower = self.lower_value
+        old_upper = upper = self.upper_value
+        queue_seek = self._queue_seek
+        
+        if handle == 'lower':
+            if value < upper:
+                lower = value
+                # Seek playback to the start handle position (debounced)
+                queue_seek(lower)
+        elif handle == 'upper':
+            if value > lower:
                 # Check if we need to maintain maximum duration (30 seconds)
-                parent = self.parent()
-                if hasattr(parent, 'enforce_duration_limit') and parent.enforce_duration_limit and parent.video_duration > 0:
-                    # Calculate exact duration in milliseconds
-                    duration_ms = round((value - self.lower_value) / 100 * parent.video_duration)
-                    # Calculate exact percentage needed for 30 seconds
-                    max_duration_percent = round((parent.max_clip_duration / parent.video_duration) * 100, 3)
-                    
+                max_clip_ms = self._max_clip_ms
+                if self._limit_active:
                     # If the range would exceed max duration, calculate exact lower handle position
-                    if duration_ms > parent.max_clip_duration:
+                    if value - lower > max_clip_ms:
                         # Move lower handle to maintain exact max duration
-                        self.lower_value = round(value - max_duration_percent, 3)
-                        # Also update playback when lower handle is auto-moved
-                        self.valueClicked.emit(self.lower_value)
+                        lower = value - max_clip_ms
+                        # Also update playback when lower handle is auto-moved (debounced)
+                        queue_seek(lower)
                 
-                self.upper_value = value
-                # Emit valueClicked to update playback position to the end handle position
-                self.valueClicked.emit(self.upper_value)
+                upper = value
+                # Seek playback to the end handle position (debounced)
+                queue_seek(upper)
         
-        self.rangeChanged.emit(self.lower_value, self.upper_value)
-        self.update()
+        self.lower_value = lower
+        self.upper_value = upper
+        self.rangeChanged.emit(lower, upper)
+        self.update_handles(old_lower, old_upper)
         
     def mouseReleaseEvent(self, event):
         """
         Handle mouse release events.
         
-        Simply clears the active handle state, ending any drag operation.
+        Clears the active handle state, ending any drag operation, and
+        applies any seek still waiting in the debounce timer so playback
+        always lands on the final handle position.
         The next click will start a new interaction.
         """
-        self.active_handle = None
\ No newline at end of file
+        self.active_handle = None
+        self._seek_timer.stop()
+        self._flush_seek()
\ No newline at end of file
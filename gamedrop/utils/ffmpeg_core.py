@@ -64,16 +64,52 @@ import shutil
 import tarfile
 import zipfile
 import re
+import functools
+import glob
+import hashlib
+import selectors
+import uuid
 from pathlib import Path
 from gamedrop.platform_utils import is_windows, is_linux, is_steam_deck, has_vaapi_support
 from gamedrop.utils.paths import get_ffmpeg_directory
+from gamedrop.version import VERSION
+
+# The platform never changes while the app runs, so detect it once
+_IS_WINDOWS = is_windows()
+_IS_LINUX = is_linux()
+# This probes device files, so only run it on first use (is_steam_deck caches itself)
+_has_vaapi_support = functools.lru_cache(maxsize=1)(has_vaapi_support)
 
 # Windows-specific constant for subprocess to hide console window
-CREATE_NO_WINDOW = 0x08000000 if is_windows() else 0
+CREATE_NO_WINDOW = 0x08000000 if _IS_WINDOWS else 0
+
+# One libx264 thread per logical CPU
+_X264_THREADS = max(1, os.cpu_count() or 4)
+
+# Shared HTTP session so downloads and Discord uploads reuse connections
+_SESSION = requests.Session()
+_SESSION.headers['User-Agent'] = f'GameDrop/{VERSION}'
 
 # Setup logging
 logger = logging.getLogger("GameDrop.FFmpeg")
 
+# Encoded position from FFmpeg's "-progress" key=value output, in microseconds.
+# Older builds only write out_time_ms, which despite its name is microseconds too.
+_OUT_TIME_RE = re.compile(rb'out_time_(?:us|ms)=(\d+)')
+_MEMORY_ERROR_MARKERS = (b"Cannot allocate memory", b"out of memory")
+# How much of the end of stderr to keep for error messages
+_STDERR_TAIL_BYTES = 8192
+
+# NVIDIA encoders do two-pass internally (-multipass), so they never use -pass 1/2
+_NVENC_CODECS = frozenset(("h264_nvenc", "hevc_nvenc"))
+_VAAPI_CODECS = frozenset(("h264_vaapi", "hevc_vaapi"))
+# Output targets of the first pass of a 2-pass encode
+_NULL_DEVS = frozenset(("NUL", "/dev/null"))
+_NULL_DEV = 'NUL' if _IS_WINDOWS else '/dev/null'
+# Output arguments shared by every encoded clip
+_AUDIO_ARGS = ('-c:a', 'aac', '-b:a', '128k')
+_FASTSTART = ('-movflags', '+faststart')
+
 
 def _get_clean_env():
     """
@@ -108,23 +144,111 @@ def _get_clean_env():
     return env
 
 
+@functools.lru_cache(maxsize=32)
+def _probe_audio_stream(ffprobe_path, input_path, mtime, size):
+    """
+    Return (codec_name, bit_rate) of the first audio stream, or None.
+    mtime and size are only part of the cache key, so an edited file is probed again.
+    """
+    try:
+        result = subprocess.run(
+            [ffprobe_path, '-v', 'error', '-select_streams', 'a:0',
+             '-show_entries', 'stream=codec_name,bit_rate', '-of', 'csv=p=0', input_path],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+            timeout=15, creationflags=CREATE_NO_WINDOW, env=_get_clean_env()
+        )
+        fields = result.stdout.strip().split(',')
+        if result.returncode != 0 or not fields[0]: return None
+        bit_rate = int(fields[1]) if len(fields) > 1 and fields[1].isdigit() else None
+        return fields[0], bit_rate
+    except Exception as e:
+        logger.warning(f"Audio probe failed for {input_path}: {e}")
+        return None
+
+def _can_copy_audio(input_path, ffmpeg_path):
+    """
+    Check whether the input's audio can be stream-copied instead of re-encoded.
+    Only AAC at or below the 128 kbps the size budget allows for is copied.
+    """
+    ffprobe_path = os.path.join(os.path.dirname(ffmpeg_path), 'ffprobe.exe' if _IS_WINDOWS else 'ffprobe')
+    if not os.path.exists(ffprobe_path):
+        ffprobe_path = shutil.which('ffprobe')
+        if not ffprobe_path: return False
+    try: stat = os.stat(input_path)
+    except OSError: return False
+    audio = _probe_audio_stream(ffprobe_path, input_path, stat.st_mtime, stat.st_size)
+    return bool(audio) and audio[0] == 'aac' and audio[1] is not None and audio[1] <= 128000
+
+class FFmpegCancelled(Exception):
+    """Raised when an encode is stopped through its cancel_event."""
+
+
+def _nvenc_profile(codec, extra_quality, duration):
+    # NVIDIA NVENC: p1-p7 presets, the legacy names are deprecated
+    return ['-preset', 'p7' if extra_quality else 'p5', '-tune', 'hq', '-rc', 'vbr',
+            '-multipass', 'fullres', '-rc-lookahead', '20', '-spatial_aq', '1']
+
+
+def _amf_profile(codec, extra_quality, duration):
+    # AMD AMF
+    return ['-quality', 'quality' if extra_quality else 'balanced']
+
+
+def _qsv_profile(codec, extra_quality, duration):
+    # Intel QSV also uses presets
+    return ['-preset', 'slow' if extra_quality else 'medium']
+
+
+def _vaapi_profile(codec, extra_quality, duration):
+    # VA-API doesn't need special presets - keep it simple
+    return []
+
+
+def _x264_profile(codec, extra_quality, duration):
+    # Default preset for libx264 and other standard encoders
+    if extra_quality: preset = 'slow'
+    # For short clips medium is barely better than faster but takes 2-3x as long
+    elif codec == 'h264' and duration < 60: preset = 'faster'
+    else: preset = 'medium'
+    args = ['-preset', preset]
+    if codec == 'h264':
+        # libx264 defaults to 1.5 threads per core, which thrashes on small APUs
+        # On the Steam Deck the clip is usually cut while a game is still running,
+        # so stay on half of its 8 threads
+        threads = min(_X264_THREADS, 4) if is_steam_deck() else _X264_THREADS
+        args.extend(['-threads', str(threads)])
+    return args
+
+
+# Encoder-specific preset/quality options, keyed by codec; anything else gets _x264_profile
+_CODEC_PROFILES = {
+    'h264_nvenc': _nvenc_profile, 'hevc_nvenc': _nvenc_profile,
+    'h264_amf': _amf_profile, 'hevc_amf': _amf_profile,
+    'h264_qsv': _qsv_profile, 'hevc_qsv': _qsv_profile,
+    'h264_vaapi': _vaapi_profile, 'hevc_vaapi': _vaapi_profile,
+}
+
+
 def _ffmpeg_run_pass(input_path, start_time, end_time, output_path_or_null, codec, bitrate,
                      resolution, ffmpeg_path, pass_num,
                      passlog_file, single_pass_progress_callback=None,
-                     hwaccel_args=None, current_codec_for_pass=None, crop_mode=None, extra_quality=False):
+                     hwaccel_args=None, crop_mode=None, extra_quality=False,
+                     cancel_event=None):
     """
     Executes a single FFmpeg encoding pass.
     For pass 1, output_path_or_null should be the system's null device path.
     For pass 2 or single pass, it's the actual output file path.
+    If cancel_event (a threading.Event) gets set, FFmpeg is terminated and
+    FFmpegCancelled is raised.
     """
     original_duration = round(end_time - start_time, 3)
     if original_duration <= 0:
         original_duration = 0.001
         logger.warning(f"Calculated duration is {original_duration}, setting to 0.001 to avoid errors.")
 
-    command = [ffmpeg_path, '-y']
-
-    active_codec = current_codec_for_pass if current_codec_for_pass else codec
+    # Machine-readable progress instead of the human stats line; it goes to stderr
+    # so a single pipe carries both progress and errors
+    command = [ffmpeg_path, '-y', '-nostats', '-progress', 'pipe:2']
 
     if hwaccel_args: # Should be a list of strings
         command.extend(hwaccel_args)
@@ -133,7 +257,7 @@ def _ffmpeg_run_pass(input_path, start_time, end_time, output_path_or_null, code
         '-ss', f'{start_time:.3f}',
         '-i', input_path,
         '-t', f'{original_duration:.3f}',
-        '-c:v', active_codec,
+        '-c:v', codec,
     ])
 
     if bitrate != "0":
@@ -141,31 +265,23 @@ def _ffmpeg_run_pass(input_path, start_time, end_time, output_path_or_null, code
         # The -pass and -passlogfile flags are only for true 2-pass encoding
         # Don't use them for single-pass operations (pass_num == 1 and it's not the first pass of a 2-pass)
         # We can detect true 2-pass by checking if output is null device for pass 1
-        is_true_two_pass = pass_num == 1 and output_path_or_null in ['NUL', '/dev/null']
-        if is_true_two_pass or pass_num == 2:
+        is_true_two_pass = pass_num == 1 and output_path_or_null in _NULL_DEVS
+        if (is_true_two_pass or pass_num == 2) and codec not in _NVENC_CODECS:
             command.extend(['-pass', str(pass_num)])
             command.extend(['-passlogfile', passlog_file])
 
 
-    # Video filter configuration
+    # Video filter configuration (hwaccel_args only carry input options, never a -vf)
     vf_options = []
-    existing_vf_value = None
-    vf_index_in_command = -1
-    for i, arg in enumerate(command): # Check if -vf is already in command (e.g. from hwaccel_args)
-        if arg == '-vf' and i + 1 < len(command):
-            existing_vf_value = command[i+1]
-            vf_index_in_command = i + 1
-            if existing_vf_value: vf_options.append(existing_vf_value)
-            break
-
-    if active_codec in ["h264_vaapi", "hevc_vaapi"]:
+
+    if codec in _VAAPI_CODECS:
         if crop_mode == "vertical": vf_options.append('crop=ih*9/16:ih')
         elif crop_mode == "landscape": vf_options.append('crop=ih*16/9:ih')
 
-        # All VA-API encoders need the proper hardware upload pipeline
-        if not any('format=nv12' in opt for opt in vf_options): 
+        # Frames decoded into VA-API surfaces (-hwaccel_output_format vaapi) are
+        # already on the GPU; anything else needs the hardware upload pipeline
+        if not (hwaccel_args and '-hwaccel_output_format' in hwaccel_args):
             vf_options.append('format=nv12')
-        if not any('hwupload' in opt for opt in vf_options): 
             vf_options.append('hwupload')
         
         if resolution: # VA-API scaling
@@ -174,74 +290,114 @@ def _ffmpeg_run_pass(input_path, start_time, end_time, output_path_or_null, code
                 # Steam Deck: use simpler scale_vaapi without explicit format parameter
                 vf_options.append(f'scale_vaapi=w={w}:h={h}')
             else:
-                # Other Linux systems: use full scale_vaapi with format
-                vf_options.append(f'scale_vaapi=w={w}:h={h}:format=nv12')
+                # Other Linux systems: use full scale_vaapi with format, on the fast scaler path
+                vf_options.append(f'scale_vaapi=w={w}:h={h}:format=nv12:mode=fast')
+    elif codec in _NVENC_CODECS and hwaccel_args and 'cuda' in hwaccel_args:
+        # Frames are decoded into CUDA memory, so scale on the GPU instead of
+        # copying them back to system memory for the CPU scaler. Fit inside the
+        # target like the CPU path does, so non-16:9 sources aren't stretched.
+        if resolution:
+            w, h = resolution.split('x')
+            vf_options.append(f'scale_cuda=w={w}:h={h}:force_original_aspect_ratio=decrease:format=nv12')
     else:
         if crop_mode == "vertical": vf_options.append('crop=ih*9/16:ih')
         elif crop_mode == "landscape": vf_options.append('crop=ih*16/9:ih')
 
         if resolution: # Non-VAAPI scaling
             w, h = resolution.split('x')
-            vf_options.append(f'scale={w}:{h}:force_original_aspect_ratio=decrease')
-
-    if vf_options: # Apply collected vf options
-        final_vf_string = ','.join(filter(None, vf_options))
-        if vf_index_in_command != -1: command[vf_index_in_command] = final_vf_string # Update existing
-        else: command.extend(['-vf', final_vf_string]) # Add new
+            scale_filter = f'scale={w}:{h}:force_original_aspect_ratio=decrease'
+            if output_path_or_null in _NULL_DEVS:
+                # Pass 1 only gathers rate-control stats. x264 needs the same frame
+                # size as pass 2, but not the same scaling quality.
+                scale_filter += ':flags=fast_bilinear'
+            vf_options.append(scale_filter)
+
+    if vf_options and codec != 'copy': # Apply collected vf options, filters can't be used with -c:v copy
+        command.extend(['-vf', ','.join(vf_options)])
+
+    # Preset and quality settings for re-encoding passes (bitrate != "0").
+    # These are output options, so they must come before the output path.
+    if bitrate != "0":
+        command.extend(_CODEC_PROFILES.get(codec, _x264_profile)(codec, extra_quality, original_duration))
 
     # Pass specific output and audio settings
-    if pass_num == 1 and bitrate != "0" and output_path_or_null in ['NUL', '/dev/null']: # Check if it's a first pass of a 2-pass
+    if pass_num == 1 and bitrate != "0" and output_path_or_null in _NULL_DEVS: # Check if it's a first pass of a 2-pass
         command.extend(['-an', '-f', 'null', output_path_or_null])
     else: # This covers pass 2 of 2-pass, single re-encode pass, or stream copy
         if bitrate != "0": # Re-encoding (pass 2 or single re-encode)
-            command.extend(['-c:a', 'aac', '-b:a', '128k'])
+            if _can_copy_audio(input_path, ffmpeg_path): # Already AAC within budget, keep it as is
+                command.extend(['-c:a', 'copy'])
+            else:
+                command.extend(_AUDIO_ARGS)
         else: # Stream copy
             command.extend(['-c:a', 'copy'])
-        command.extend(['-movflags', '+faststart', output_path_or_null]) # Actual output file for these cases
+        command.extend((*_FASTSTART, output_path_or_null)) # Actual output file for these cases
 
-    # Preset and quality settings for re-encoding passes (bitrate != "0")
-    if bitrate != "0":
-        # Default preset for libx264 and other standard encoders
-        if active_codec not in ['h264_amf', 'hevc_amf', 'h264_vaapi', 'hevc_vaapi', 'h264_qsv', 'hevc_qsv']:
-            preset = 'slow' if extra_quality else 'medium'
-            if '-preset' not in command: command.extend(['-preset', preset])
-        elif 'amf' in active_codec: # AMD AMF
-            quality = 'quality' if extra_quality else 'balanced'
-            if '-quality' not in command: command.extend(['-quality', quality])
-        elif 'qsv' in active_codec: # Intel QSV
-            preset = 'slow' if extra_quality else 'medium'
-            if '-preset' not in command: command.extend(['-preset', preset]) # QSV also uses presets
-            # Consider adding QSV specific options like -look_ahead 0 if beneficial and not in hwaccel_args
-        elif 'vaapi' in active_codec and is_steam_deck():
-            # Steam Deck VA-API doesn't need special presets - keep it simple like original
-            pass
-
-    logger.info(f"FFmpeg Pass {pass_num} command: {' '.join(command)}")
+    if logger.isEnabledFor(logging.INFO): # Skip joining the long command line when it won't be logged
+        logger.info(f"FFmpeg Pass {pass_num} command: {' '.join(command)}")
     process = subprocess.Popen(
         command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-        universal_newlines=True, cwd=os.path.expanduser('~'),
+        bufsize=0, cwd=os.path.expanduser('~'),
         creationflags=CREATE_NO_WINDOW,
+        # Own session on POSIX so a Ctrl+C sent to the app doesn't kill the encode
+        start_new_session=not _IS_WINDOWS,
         env=_get_clean_env()
     )
 
-    time_pattern = re.compile(r'time=(\d+:\d+:\d+.\d+)')
+    # Read stderr in large raw chunks and only parse complete lines (ending in
+    # \n or \r); a partial line is carried over to the next chunk
+    fd = process.stderr.fileno()
+    log_output = logger.isEnabledFor(logging.DEBUG)
+    duration_us = original_duration * 1000000 # original_duration is always > 0 here
+    inv_duration_us = 100.0 / duration_us
+    last_progress = -1
     memory_error = False
-    while True:
-        line = process.stderr.readline()
-        if not line and process.poll() is not None: break
-        if line.strip():
-            logger.debug(f"FFmpeg Pass {pass_num} output: {line.strip()}")
-            if "Cannot allocate memory" in line or "out of memory" in line: memory_error = True
-        match = time_pattern.search(line)
-        if match and single_pass_progress_callback:
-            time_str = match.group(1); parts = time_str.split(':'); h = int(parts[0]); m = int(parts[1]); s_parts = parts[2].split('.')
-            s = int(s_parts[0]); ms_str = s_parts[1] if len(s_parts) > 1 else "0"; ms = int(ms_str) if ms_str.isdigit() else 0
-            current_seconds = h * 3600 + m * 60 + s + ms / (10 ** len(ms_str))
-            progress = min(100, int((current_seconds / original_duration) * 100)) if original_duration > 0 else (100 if current_seconds > 0 else 0)
-            single_pass_progress_callback(progress)
+    carry = bytearray()
+    stderr_tail = b""
+    # On POSIX wait on stderr with a timeout so cancel_event is noticed even when
+    # FFmpeg is quiet; Windows pipes can't be selected, so there it is checked per chunk
+    selector = None
+    if cancel_event is not None and not _IS_WINDOWS:
+        selector = selectors.DefaultSelector()
+        selector.register(fd, selectors.EVENT_READ)
+    try:
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                logger.info(f"FFmpeg Pass {pass_num} cancelled, terminating FFmpeg")
+                process.terminate()
+                try: process.wait(5)
+                except subprocess.TimeoutExpired: process.kill(); process.wait()
+                raise FFmpegCancelled(f"FFmpeg Pass {pass_num} cancelled")
+            if selector is not None and not selector.select(0.2): continue
+            chunk = os.read(fd, 65536)
+            if not chunk: break # EOF, FFmpeg has closed stderr
+            carry += chunk
+            last_eol = max(carry.rfind(b'\n'), carry.rfind(b'\r'))
+            if last_eol < 0: continue
+            lines = bytes(carry[:last_eol + 1])
+            del carry[:last_eol + 1]
+
+            stderr_tail = (stderr_tail + lines)[-_STDERR_TAIL_BYTES:]
+            if not memory_error and any(marker in lines for marker in _MEMORY_ERROR_MARKERS): memory_error = True
+            if log_output:
+                for line in lines.splitlines():
+                    line = line.strip()
+                    if line: logger.debug("FFmpeg Pass %d output: %s", pass_num, line.decode(errors='replace'))
+
+            if single_pass_progress_callback:
+                matches = _OUT_TIME_RE.findall(lines)
+                if matches: # Only the latest time in the chunk matters
+                    out_time_us = int(matches[-1])
+                    progress = int(out_time_us * inv_duration_us) if out_time_us < duration_us else 100
+                    if progress != last_progress:
+                        last_progress = progress
+                        single_pass_progress_callback(progress)
+    finally:
+        if selector is not None: selector.close()
+        process.stderr.close() # Don't leave the pipe fd to the garbage collector
 
     returncode = process.wait()
-    full_stderr = process.stderr.read() if process.stderr else ""
+    full_stderr = (stderr_tail + bytes(carry))[-_STDERR_TAIL_BYTES:].decode(errors='replace')
     if returncode != 0:
         err_msg = f"FFmpeg Pass {pass_num} failed. RC: {returncode}. Stderr: {full_stderr}"
         if memory_error or "Cannot allocate memory" in full_stderr or "out of memory" in full_stderr:
@@ -253,9 +409,14 @@ def _ffmpeg_run_pass(input_path, start_time, end_time, output_path_or_null, code
     logger.info(f"FFmpeg Pass {pass_num} completed successfully.")
     return True
 
+@functools.lru_cache(maxsize=1)
 def get_ffmpeg_path():
+    """
+    Return the FFmpeg executable path for this platform.
+    The result is cached; invalidate_ffmpeg_cache() clears it (download_ffmpeg() does so).
+    """
     ffmpeg_dir = get_ffmpeg_directory()
-    if is_windows():
+    if _IS_WINDOWS:
         local_ffmpeg = os.path.join(ffmpeg_dir, 'ffmpeg.exe')
         if os.path.exists(local_ffmpeg): return local_ffmpeg
         ffmpeg_in_path = shutil.which("ffmpeg")
@@ -267,7 +428,7 @@ def get_ffmpeg_path():
         return local_ffmpeg
     else: # Linux
         ffmpeg_in_path = shutil.which("ffmpeg")
-        if ffmpeg_in_path and is_linux(): return ffmpeg_in_path
+        if ffmpeg_in_path and _IS_LINUX: return ffmpeg_in_path
         local_ffmpeg = os.path.join(ffmpeg_dir, 'ffmpeg')
         if os.path.exists(local_ffmpeg): return local_ffmpeg
         if getattr(sys, 'frozen', False):
@@ -276,10 +437,28 @@ def get_ffmpeg_path():
             return os.path.join(config_path, 'ffmpeg')
         return local_ffmpeg
 
+# (path, mtime) of the FFmpeg binary that last passed check_ffmpeg_installed()
+_verified_ffmpeg = None
+
+def invalidate_ffmpeg_cache():
+    """Forget the cached FFmpeg path and verification, e.g. after installing a new binary."""
+    global _verified_ffmpeg
+    get_ffmpeg_path.cache_clear()
+    _verified_ffmpeg = None
+
 def check_ffmpeg_installed():
+    """
+    Check that FFmpeg can be run. A successful `ffmpeg -version` is remembered
+    for that binary (path and modification time), so later checks skip the
+    subprocess. Failures are never cached, so a fixed install is picked up.
+    """
+    global _verified_ffmpeg
     ffmpeg_path = get_ffmpeg_path()
+    try: ffmpeg_key = (ffmpeg_path, os.stat(ffmpeg_path).st_mtime)
+    except OSError: ffmpeg_key = None
+    if ffmpeg_key is not None and ffmpeg_key == _verified_ffmpeg: return True
     clean_env = _get_clean_env()
-    if os.path.exists(ffmpeg_path) and os.access(ffmpeg_path, os.X_OK):
+    if ffmpeg_key is not None and os.access(ffmpeg_path, os.X_OK):
         try:
             result = subprocess.run(
                 [ffmpeg_path, '-version'],
@@ -287,9 +466,11 @@ def check_ffmpeg_installed():
                 timeout=5, creationflags=CREATE_NO_WINDOW,
                 env=clean_env
             )
-            if result.returncode == 0 and b'ffmpeg version' in result.stdout: return True
+            if result.returncode == 0 and b'ffmpeg version' in result.stdout:
+                _verified_ffmpeg = ffmpeg_key
+                return True
         except Exception as e: logger.warning(f"FFmpeg at {ffmpeg_path} failed execution: {e}")
-    if is_linux():
+    if _IS_LINUX:
         try:
             result = subprocess.run(
                 ['ffmpeg', '-version'],
@@ -301,58 +482,121 @@ def check_ffmpeg_installed():
     logger.warning(f"FFmpeg not available or not functional at {ffmpeg_path}.")
     return False
 
+class _ProgressReader:
+    """
+    File-like wrapper around a download stream that counts the bytes read,
+    feeds them to an optional hashlib object and reports download progress
+    (0-50%) whenever the whole percentage changes.
+    """
+    def __init__(self, raw, total_size, progress_callback, hasher=None):
+        self.raw = raw
+        self.total_size = total_size
+        self.progress_callback = progress_callback
+        self.hasher = hasher
+        self.downloaded_size = 0
+        self.last_progress = -1
+
+    def read(self, size=-1):
+        data = self.raw.read(size)
+        self.downloaded_size += len(data)
+        if self.hasher: self.hasher.update(data)
+        if self.progress_callback and self.total_size:
+            progress = int(self.downloaded_size * 50 / self.total_size)
+            if progress != self.last_progress:
+                self.last_progress = progress
+                self.progress_callback(progress)
+        return data
+
+def _fetch_expected_checksum(checksum_url):
+    """
+    Fetch the checksum the FFmpeg mirror publishes next to its build.
+    Returns the lowercase hex digest, or None if it could not be retrieved.
+    """
+    try:
+        r = _SESSION.get(checksum_url, timeout=15); r.raise_for_status()
+        digest = r.text.split()[0].strip().lower()
+        int(digest, 16) # Make sure it is actually a hex digest
+        return digest
+    except Exception as e:
+        logger.warning(f"Could not fetch FFmpeg checksum from {checksum_url}: {e}")
+        return None
+
+def _verify_download_checksum(hasher, expected_digest, hash_name):
+    """Raise if the downloaded archive doesn't match the published checksum."""
+    if expected_digest is None:
+        logger.warning("Skipping FFmpeg checksum validation, no published checksum available.")
+    elif hasher.hexdigest() != expected_digest:
+        raise Exception(f"FFmpeg download checksum mismatch ({hash_name}): expected {expected_digest}, got {hasher.hexdigest()}")
+    else:
+        logger.info(f"FFmpeg download {hash_name} checksum verified.")
+
 def download_ffmpeg(progress_callback=None):
     ffmpeg_path = get_ffmpeg_path()
     ffmpeg_dir = os.path.dirname(ffmpeg_path)
     os.makedirs(ffmpeg_dir, exist_ok=True)
-    if is_windows(): url, dl_name, bin_name = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip", "ffmpeg.zip", "ffmpeg.exe"
-    elif is_linux(): url, dl_name, bin_name = "https://johnvansickle.com/ffmpeg/releases/ffmpeg-release-amd64-static.tar.xz", "ffmpeg.tar.xz", "ffmpeg"
+    # Both mirrors publish a checksum file next to the build: gyan.dev a SHA-256, johnvansickle.com an MD5
+    if _IS_WINDOWS: url, dl_name, bin_name, hash_name = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip", "ffmpeg.zip", "ffmpeg.exe", "sha256"
+    elif _IS_LINUX: url, dl_name, bin_name, hash_name = "https://johnvansickle.com/ffmpeg/releases/ffmpeg-release-amd64-static.tar.xz", "ffmpeg.tar.xz", "ffmpeg", "md5"
     else: raise Exception("Unsupported platform for FFmpeg download.")
     download_path = os.path.join(ffmpeg_dir, dl_name)
+    # Binary extracted from the streamed tar.xz; only moved to ffmpeg_path once the checksum matches
+    staged_path = ffmpeg_path + ".download"
     try:
-        r = requests.get(url, stream=True); r.raise_for_status(); total_size = int(r.headers.get('content-length',0)); downloaded_size = 0
-        with open(download_path, 'wb') as f:
-            for chunk in r.iter_content(chunk_size=8192):
-                f.write(chunk); downloaded_size += len(chunk)
-                if progress_callback and total_size: progress_callback(int(downloaded_size * 50 / total_size))
-        if progress_callback: progress_callback(50)
+        expected_digest = _fetch_expected_checksum(f"{url}.{hash_name}")
+        hasher = hashlib.new(hash_name)
+        r = _SESSION.get(url, stream=True); r.raise_for_status(); total_size = int(r.headers.get('content-length',0))
+        r.raw.decode_content = True # Undo any transfer compression while streaming from the raw socket
+        # The archive is hashed as it is read, in the same pass that stores or extracts it
+        reader = _ProgressReader(r.raw, total_size, progress_callback, hasher)
+        # Only the ffmpeg binary is needed, so stream that one member straight out
+        # instead of extracting it (and its folder) and moving it
         if dl_name.endswith(".zip"):
+            # A zip's index is at the end of the file, so it has to be on disk before extracting
+            with open(download_path, 'wb') as f:
+                shutil.copyfileobj(reader, f, 1024 * 1024)
+            _verify_download_checksum(hasher, expected_digest, hash_name)
+            if progress_callback: progress_callback(50)
             with zipfile.ZipFile(download_path, 'r') as zf:
                 member = next((m for m in zf.namelist() if m.endswith(f'/{bin_name}') or m == bin_name), None)
                 if not member: raise Exception(f"{bin_name} not found in archive.")
-                zf.extract(member, ffmpeg_dir)
-                extracted_path = os.path.join(ffmpeg_dir, member)
-                if ffmpeg_path != extracted_path : shutil.move(extracted_path, ffmpeg_path)
-                if os.path.dirname(extracted_path) != ffmpeg_dir : shutil.rmtree(os.path.dirname(extracted_path))
+                with zf.open(member) as src, open(staged_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+            os.replace(staged_path, ffmpeg_path)
         elif dl_name.endswith(".tar.xz"):
-            with tarfile.open(download_path, 'r:xz') as tf:
-                member = next((m for m in tf.getmembers() if m.name.endswith(f'/{bin_name}') or m.name == bin_name), None)
+            # tar.xz can be decompressed as it arrives, so no temporary archive is written
+            with tarfile.open(fileobj=reader, mode='r|xz') as tf:
+                member = next((m for m in tf if m.isfile() and (m.name.endswith(f'/{bin_name}') or m.name == bin_name)), None)
                 if not member: raise Exception(f"{bin_name} not found in archive.")
-                tf.extract(member, ffmpeg_dir) # Extracts to full path member.name
-                extracted_path = os.path.join(ffmpeg_dir, member.name)
-                if ffmpeg_path != extracted_path: shutil.move(extracted_path, ffmpeg_path) # Ensure it's at the target path
-                if os.path.dirname(extracted_path) != ffmpeg_dir : shutil.rmtree(os.path.dirname(extracted_path))
+                with tf.extractfile(member) as src, open(staged_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+            # Read the rest of the download so the checksum covers the whole archive
+            while reader.read(1024 * 1024): pass
+            _verify_download_checksum(hasher, expected_digest, hash_name)
+            os.replace(staged_path, ffmpeg_path)
 
         os.chmod(ffmpeg_path, 0o755)
+        invalidate_ffmpeg_cache() # A new binary is installed, resolve and verify it again
         if progress_callback: progress_callback(100)
         return True
     except Exception as e: logger.error(f"FFmpeg download/extract error: {e}"); raise
     finally:
-        if os.path.exists(download_path): os.remove(download_path)
+        for temp_path in (download_path, staged_path):
+            if os.path.exists(temp_path): os.remove(temp_path)
 
 def get_ffmpeg_download_info():
     """Return (download_url, install_directory) for the current platform."""
     ffmpeg_path = get_ffmpeg_path()
     ffmpeg_dir = os.path.dirname(ffmpeg_path)
-    if is_windows():
+    if _IS_WINDOWS:
         return ("https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip", ffmpeg_dir)
-    elif is_linux():
+    elif _IS_LINUX:
         return ("https://johnvansickle.com/ffmpeg/releases/ffmpeg-release-amd64-static.tar.xz", ffmpeg_dir)
     return ("Unknown", ffmpeg_dir)
 
 def compress_and_send_video(input_path, start_time, end_time, output_path,
                           codec="h264", bitrate="1000k",
-                          resolution="1920x1080", progress_callback=None, crop_mode=None, discord_user=None, extra_quality=False):
+                          resolution="1920x1080", progress_callback=None, crop_mode=None, discord_user=None, extra_quality=False,
+                          cancel_event=None):
 
     ffmpeg_path = get_ffmpeg_path()
     if not os.access(ffmpeg_path, os.X_OK):
@@ -364,7 +608,12 @@ def compress_and_send_video(input_path, start_time, end_time, output_path,
         try: os.remove(output_path)
         except OSError as e: logger.warning(f"Could not remove existing output file {output_path}: {e}")
 
-    passlog_file = output_path + ".ffpass"
+    # Keep the 2-pass stats (including the multi-MB .mbtree file) in RAM when
+    # possible instead of next to the output, which may be on an SD card
+    if not _IS_WINDOWS and os.access('/dev/shm', os.W_OK):
+        passlog_file = os.path.join('/dev/shm', f"gamedrop-{os.getpid()}-{uuid.uuid4().hex}.ffpass")
+    else:
+        passlog_file = output_path + ".ffpass"
 
     # Initial codec and encoding properties
     is_stream_copy = bitrate == "0"
@@ -385,48 +634,78 @@ def compress_and_send_video(input_path, start_time, end_time, output_path,
 
     hwaccel_params_initial = []
     if is_vaapi_effective: # Only prepare VAAPI params if effective codec is VAAPI
-        vaapi_device = has_vaapi_support()
+        vaapi_device = _has_vaapi_support()
         if vaapi_device:
             if is_steam_deck():
                 logger.info("Using Steam Deck optimized VA-API configuration")
                 # Steam Deck needs hardware acceleration but with simpler parameters
                 hwaccel_params_initial.extend(['-hwaccel', 'vaapi', '-hwaccel_device', vaapi_device])
+            elif crop_mode:
+                # The crop filter runs on the CPU, so let FFmpeg hand decoded frames back to system memory
+                hwaccel_params_initial.extend(['-hwaccel', 'vaapi', '-hwaccel_device', vaapi_device])
             else:
-                # For other Linux systems, use the full hwaccel setup
+                # For other Linux systems, keep decoded frames on the GPU for scale_vaapi and the encoder
                 hwaccel_params_initial.extend(['-hwaccel', 'vaapi', '-hwaccel_device', vaapi_device, '-hwaccel_output_format', 'vaapi'])
         else: # VAAPI was chosen/effective but not supported
             logger.warning(f"VAAPI codec {effective_codec} requested but no VAAPI device found. Switching to software h264.")
             effective_codec = "h264" # Fallback to software for this attempt
             is_vaapi_effective = False # Update effective VAAPI status
             # hwaccel_params_initial remains empty for software
+    elif effective_codec in _NVENC_CODECS and not crop_mode:
+        # Keep decoded frames on the GPU for scale_cuda and NVENC. Cropping
+        # uses the CPU crop filter, so cropped clips keep the regular pipeline.
+        hwaccel_params_initial.extend(['-hwaccel', 'cuda', '-hwaccel_output_format', 'cuda'])
+
+    # Copy the packets instead of decoding and encoding every frame when the
+    # caller asks for it (bitrate "0"). Never chosen automatically: the copied
+    # packets start at the keyframe before start_time, so the file holds more
+    # than the selected range and its bitrate is the source's, not the target's.
+    if is_stream_copy and not crop_mode:
+        logger.info("Stream copying without re-encoding.")
+        try:
+            _ffmpeg_run_pass(input_path, start_time, end_time, output_path,
+                             'copy', "0", resolution, ffmpeg_path, 1, passlog_file,
+                             progress_callback, cancel_event=cancel_event)
+            if progress_callback: progress_callback(100)
+            return True
+        except FFmpegCancelled:
+            raise
+        except Exception as e_copy:
+            logger.warning(f"Stream copy failed, re-encoding instead: {e_copy}")
 
     # Main encoding attempt
     try:
         # Determine if 2-pass should be used for the current effective_codec
         # Not for VAAPI, not for stream copy, and not for Steam Deck (which worked best with single-pass)
         should_use_two_pass_initial = not is_vaapi_effective and not is_stream_copy and not is_steam_deck()
+        # NVENC gets its two passes from -multipass in a single FFmpeg run
+        should_use_two_pass_initial = should_use_two_pass_initial and effective_codec not in _NVENC_CODECS
 
         if should_use_two_pass_initial:
             logger.info(f"Attempting 2-pass encoding with codec {effective_codec}.")
             def pass1_prog_cb(p): progress_callback(int(p * 0.5)) if progress_callback else None
-            null_dev = 'NUL' if is_windows() else '/dev/null'
-            _ffmpeg_run_pass(input_path, start_time, end_time, null_dev,
+            _ffmpeg_run_pass(input_path, start_time, end_time, _NULL_DEV,
                              effective_codec, bitrate, resolution, ffmpeg_path, 1, passlog_file,
-                             pass1_prog_cb, hwaccel_params_initial, effective_codec, crop_mode, extra_quality)
+                             pass1_prog_cb, hwaccel_params_initial, crop_mode, extra_quality,
+                             cancel_event=cancel_event)
 
             def pass2_prog_cb(p): progress_callback(int(50 + p * 0.5)) if progress_callback else None
             _ffmpeg_run_pass(input_path, start_time, end_time, output_path,
                              effective_codec, bitrate, resolution, ffmpeg_path, 2, passlog_file,
-                             pass2_prog_cb, hwaccel_params_initial, effective_codec, crop_mode, extra_quality)
+                             pass2_prog_cb, hwaccel_params_initial, crop_mode, extra_quality,
+                             cancel_event=cancel_event)
         else: # Single-pass (VAAPI, stream copy, or other non-2-pass codecs like potentially some HW encoders if not libx264/x265)
             logger.info(f"Attempting single-pass encoding with codec {effective_codec}.")
             _ffmpeg_run_pass(input_path, start_time, end_time, output_path,
                              effective_codec, bitrate, resolution, ffmpeg_path, 1, passlog_file, # Pass 1 signifies a complete single operation here
-                             progress_callback, hwaccel_params_initial, effective_codec, crop_mode, extra_quality)
+                             progress_callback, hwaccel_params_initial, crop_mode, extra_quality,
+                             cancel_event=cancel_event)
 
         if progress_callback: progress_callback(100)
         return True # Initial attempt successful
 
+    except FFmpegCancelled:
+        raise # The user stopped the encode, don't fall back to software
     except Exception as e_initial:
         logger.error(f"Initial encoding attempt with {effective_codec} failed: {e_initial}")
 
@@ -446,73 +725,111 @@ def compress_and_send_video(input_path, start_time, end_time, output_path,
                 if should_use_two_pass_for_fallback:
                     logger.info("Attempting 2-pass software fallback encoding.")
                     def fb_p1_prog_cb(p): progress_callback(int(p*0.5)) if progress_callback else None
-                    null_dev = 'NUL' if is_windows() else '/dev/null'
-                    _ffmpeg_run_pass(input_path, start_time, end_time, null_dev,
+                    _ffmpeg_run_pass(input_path, start_time, end_time, _NULL_DEV,
                                      current_codec_for_fallback, bitrate, resolution, ffmpeg_path, 1, passlog_file,
-                                     fb_p1_prog_cb, hwaccel_params_fallback, current_codec_for_fallback, crop_mode, extra_quality)
+                                     fb_p1_prog_cb, hwaccel_params_fallback, crop_mode, extra_quality,
+                                     cancel_event=cancel_event)
 
                     def fb_p2_prog_cb(p): progress_callback(int(50+p*0.5)) if progress_callback else None
                     _ffmpeg_run_pass(input_path, start_time, end_time, output_path,
                                      current_codec_for_fallback, bitrate, resolution, ffmpeg_path, 2, passlog_file,
-                                     fb_p2_prog_cb, hwaccel_params_fallback, current_codec_for_fallback, crop_mode, extra_quality)
+                                     fb_p2_prog_cb, hwaccel_params_fallback, crop_mode, extra_quality,
+                                     cancel_event=cancel_event)
                 else: # Single-pass software fallback (likely for stream copy, though unusual to reach here for stream copy fail)
                     logger.info("Attempting single-pass software fallback encoding.")
                     _ffmpeg_run_pass(input_path, start_time, end_time, output_path,
                                      current_codec_for_fallback, bitrate, resolution, ffmpeg_path, 1, passlog_file,
-                                     progress_callback, hwaccel_params_fallback, current_codec_for_fallback, crop_mode, extra_quality)
+                                     progress_callback, hwaccel_params_fallback, crop_mode, extra_quality,
+                                     cancel_event=cancel_event)
 
                 if progress_callback: progress_callback(100)
                 return True # Fallback successful
+            except FFmpegCancelled:
+                raise
             except Exception as e_fallback:
                 logger.error(f"Software fallback encoding failed: {e_fallback}")
                 raise Exception(f"All encoding attempts failed. Initial: {e_initial}. Fallback: {e_fallback}")
         else: # Initial attempt was already h264 software and failed
             raise e_initial # Re-raise the exception from the initial h264 attempt
     finally:
-        # Clean up all ffmpeg 2-pass log files
-        for ext in ["", "-0.log", "-0.log.mbtree"]:
-            log_path = passlog_file + ext
-            if os.path.exists(log_path):
-                try:
-                    os.remove(log_path)
-                    logger.info(f"Cleaned up passlog file: {log_path}")
-                except OSError as ex:
-                    logger.warning(f"Could not delete passlog file {log_path}: {ex}")
+        # Clean up all ffmpeg 2-pass log files, including .temp files left by a failed pass
+        for log_path in glob.iglob(glob.escape(passlog_file) + '*'):
+            try:
+                os.unlink(log_path)
+                logger.info(f"Cleaned up passlog file: {log_path}")
+            except OSError as ex:
+                logger.warning(f"Could not delete passlog file {log_path}: {ex}")
+
+class _MultipartFileStream:
+    """
+    multipart/form-data body that streams a file from disk.
+    requests would otherwise read the whole file into memory to build the
+    body; this has a known length, so it is sent with a Content-Length
+    header and read in 1 MiB chunks while uploading.
+    """
+    def __init__(self, file_path, fields, chunk_size=1024 * 1024, file_size=None):
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+        head = []
+        for name, value in fields.items():
+            head.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n')
+        filename = os.path.basename(file_path).replace('"', '%22')
+        head.append(f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+                    'Content-Type: application/octet-stream\r\n\r\n')
+        self._head = ''.join(head).encode('utf-8')
+        self._tail = f'\r\n--{boundary}--\r\n'.encode('utf-8')
+        if file_size is None: file_size = os.path.getsize(file_path)
+        self._length = len(self._head) + file_size + len(self._tail)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        yield self._head
+        with open(self.file_path, 'rb') as f:
+            while True:
+                chunk = f.read(self.chunk_size)
+                if not chunk: break
+                yield chunk
+        yield self._tail
 
 def send_to_discord(file_path, webhook_url, title=None, discord_user=None):
     try:
         if not webhook_url: raise ValueError("Webhook URL is required")
-        if not os.path.exists(file_path): raise FileNotFoundError(f"File not found: {file_path}")
-        logger.info(f"Sending {os.path.basename(file_path)} to Discord ({os.path.getsize(file_path)/(1024*1024):.2f} MB)")
-        with open(file_path, 'rb') as f:
-            payload = {}
-            if title or discord_user:
-                content_str = f"**{title}**" if title else ""
-                embeds = []
-                if discord_user:
-                    embeds.append({
-                        "author": {
-                            "name": f"Verified Creator: {discord_user['username']}",
-                            "icon_url": discord_user.get('avatar_url') if discord_user.get('avatar_url') else ""
-                        },
-                        "color": 5793266
-                    })
-                
-                payload_json = {"content": content_str}
-                if embeds:
-                    payload_json["embeds"] = embeds
-                
-                payload['payload_json'] = json.dumps(payload_json)
-                
-            if 'payload_json' in payload:
-                r = requests.post(webhook_url, files={'file': f}, data=payload)
-            else:
-                r = requests.post(webhook_url, files={'file': f})
-                
-            r.raise_for_status()
+        try: file_size = os.stat(file_path).st_size # One stat for the existence check, log and body length
+        except FileNotFoundError: raise FileNotFoundError(f"File not found: {file_path}")
+        logger.info(f"Sending {os.path.basename(file_path)} to Discord ({file_size/(1024*1024):.2f} MB)")
+        payload = {}
+        if title or discord_user:
+            content_str = f"**{title}**" if title else ""
+            embeds = []
+            if discord_user:
+                embeds.append({
+                    "author": {
+                        "name": f"Verified Creator: {discord_user['username']}",
+                        "icon_url": discord_user.get('avatar_url') if discord_user.get('avatar_url') else ""
+                    },
+                    "color": 5793266
+                })
+            
+            payload_json = {"content": content_str}
+            if embeds:
+                payload_json["embeds"] = embeds
+            
+            payload['payload_json'] = json.dumps(payload_json)
+            
+        body = _MultipartFileStream(file_path, payload, file_size=file_size)
+        # Without a timeout a stalled connection would hang the drop worker forever
+        r = _SESSION.post(webhook_url, data=body, headers={'Content-Type': body.content_type}, timeout=(10, 300))
+        r.raise_for_status()
         logger.info(f"Successfully sent to Discord, status: {r.status_code}")
         return True
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 413: logger.error("File too large for Discord, saved locally."); raise Exception("File too large for Discord.")
         else: logger.error(f"HTTP error sending to Discord: {e}"); raise Exception(f"Failed to send (HTTP {e.response.status_code}): {e}")
+    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+        logger.error(f"Network error sending to Discord: {e}"); raise Exception(f"Failed to send (network error): {e}")
     except Exception as e: logger.error(f"Error sending to Discord: {e}"); raise Exception(f"Failed to send: {e}")
@@ -207,7 +207,9 @@ def compress_video(input_path, start_time, end_time, output_path, codec="h264",
             - "h264_amf": AMD GPU encoding
             - "hevc_vaapi": VA-API encoding on Linux
         bitrate (str, optional): Target video bitrate. Defaults to "0"
-            - "0": Copy video stream without re-encoding
+            - "0": Copy video stream without re-encoding (resolution is ignored;
+              the file starts at the preceding keyframe, and an MP4 edit list
+              makes playback start at start_time)
             - "1000k": Target 1Mbps bitrate
             - "2M": Target 2Mbps bitrate
         resolution (str, optional): Output resolution. Defaults to "1920x1080"
@@ -296,12 +298,14 @@ def send_to_discord(file_path, webhook_url, clip_title=None):
     try:
         logger.info(f"Preparing to send clip to Discord webhook: {file_path}")
         
-        # Validate file size before sending
-        if os.path.exists(file_path):
-            size_mb = os.path.getsize(file_path) / (1024*1024)
-            if size_mb > 10:
-                logger.warning(f"File size ({size_mb:.2f} MB) exceeds Discord 10MB limit")
-                return False
+        # Validate file size before sending (one stat; a missing file is left to the sender)
+        try:
+            file_size = os.stat(file_path).st_size
+        except FileNotFoundError:
+            file_size = 0
+        if file_size > 10 * 1024 * 1024:
+            logger.warning(f"File size ({file_size / (1024*1024):.2f} MB) exceeds Discord 10MB limit")
+            return False
 
         # Send to Discord
         result = discord_sender(file_path, webhook_url, clip_title)
@@ -13,15 +13,16 @@ Hardware Types:
 Detection Process:
 1. First checks for Steam Deck hardware (uses VA-API)
 2. On Windows:
-   - Checks for NVIDIA using nvidia-smi tool
-   - Checks for AMD using PowerShell WMI queries
+   - Checks for NVIDIA using the driver's NVML library (nvidia-smi if it can't be loaded)
+   - Checks for AMD by enumerating the display adapters (EnumDisplayDevices)
    - Falls back to software encoding if no GPU detected
 3. On Linux:
-   - Checks for NVIDIA using nvidia-smi
+   - Checks for NVIDIA using the driver's NVML library (nvidia-smi if it can't be loaded)
    - Checks for VA-API support (Intel/AMD)
    - Falls back to software encoding if no acceleration available
 """
 
+import functools
 import platform
 import subprocess
 import os
@@ -41,6 +42,153 @@ def get_subprocess_startupinfo():
         return startupinfo
     return None
 
+def _nvml_gpu_present():
+    """
+    Check for a usable NVIDIA GPU through the driver's NVML library.
+    
+    This is the library nvidia-smi itself uses, so loading it in-process
+    gives the same answer without starting a process.
+    
+    Returns:
+        bool or None: Whether NVML initializes, or None if it can't be loaded
+    """
+    import ctypes
+    try:
+        nvml = ctypes.CDLL('nvml.dll' if is_windows() else 'libnvidia-ml.so.1')
+        nvml_init = nvml.nvmlInit_v2
+    except (OSError, AttributeError):
+        return None
+    if nvml_init() != 0: # NVML_SUCCESS
+        return False
+    nvml.nvmlShutdown()
+    return True
+
+def _enum_display_devices():
+    """
+    Return the upper-cased names of the Windows display adapters.
+    
+    Calls user32's EnumDisplayDevicesW directly, which takes well under a
+    millisecond, where a PowerShell WMI query has to start the whole
+    PowerShell runtime first.
+    """
+    import ctypes
+
+    class DISPLAY_DEVICEW(ctypes.Structure):
+        _fields_ = [
+            ('cb', ctypes.c_uint32),
+            ('DeviceName', ctypes.c_wchar * 32),
+            ('DeviceString', ctypes.c_wchar * 128),
+            ('StateFlags', ctypes.c_uint32),
+            ('DeviceID', ctypes.c_wchar * 128),
+            ('DeviceKey', ctypes.c_wchar * 128),
+        ]
+
+    enum_display_devices = ctypes.windll.user32.EnumDisplayDevicesW
+    names = []
+    for index in range(16):
+        device = DISPLAY_DEVICEW()
+        device.cb = ctypes.sizeof(device)
+        if not enum_display_devices(None, index, ctypes.byref(device), 0):
+            break # No more adapters
+        names.append(device.DeviceString.upper())
+    return names
+
+@functools.lru_cache(maxsize=1)
+def _detect_gpu_type():
+    """
+    Detect the available GPU once per process and return its type.
+    
+    Detection loads driver libraries and may spawn nvidia-smi, so the
+    result is cached; GPU.invalidate_cache() clears it.
+    """
+    try:
+        if is_steam_deck():
+            # Check for VA-API support on Steam Deck (it should have it)
+            vaapi_device = has_vaapi_support()
+            if vaapi_device:
+                gpu_type = 'VA-API'
+                logger.info("Steam Deck detected with VA-API support - using hardware acceleration")
+            else:
+                gpu_type = 'Software'
+                logger.info("Steam Deck detected without VA-API support - falling back to software encoding")
+            return gpu_type
+
+        if is_windows():
+            startupinfo = get_subprocess_startupinfo()
+            # Check for NVIDIA GPU using NVML, or nvidia-smi if NVML can't be loaded
+            try:
+                nvml_found = _nvml_gpu_present()
+                if nvml_found:
+                    gpu_type = 'NVIDIA'
+                    logger.info("NVIDIA GPU detected")
+                    return gpu_type
+                # First check if nvidia-smi exists
+                nvidia_smi_path = shutil.which('nvidia-smi') if nvml_found is None else None
+                if nvidia_smi_path:
+                    nvidia_smi = subprocess.run(
+                        [nvidia_smi_path], 
+                        stdout=subprocess.PIPE, 
+                        stderr=subprocess.PIPE, 
+                        startupinfo=startupinfo,
+                        creationflags=subprocess.CREATE_NO_WINDOW
+                    )
+                    if nvidia_smi.returncode == 0:
+                        gpu_type = 'NVIDIA'
+                        logger.info("NVIDIA GPU detected")
+                        return gpu_type
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Error checking for NVIDIA GPU: {str(e)}")
+
+            # Check for AMD GPU by asking Windows for its display adapters
+            try:
+                adapters = _enum_display_devices()
+                if any('AMD' in name or 'RADEON' in name for name in adapters):
+                    gpu_type = 'AMD'
+                    logger.info("AMD GPU detected")
+                    return gpu_type
+            except Exception as e:
+                logger.warning(f"Error checking for AMD GPU: {str(e)}")
+
+            # Default to Intel/Software
+            gpu_type = 'Software'
+            logger.info("No dedicated GPU detected, using software encoding")
+
+        elif is_linux():
+            # Check for NVIDIA GPU
+            try:
+                nvml_found = _nvml_gpu_present()
+                if nvml_found is None: # NVML can't be loaded, ask nvidia-smi instead (if it's installed)
+                    nvidia_smi_path = shutil.which('nvidia-smi')
+                    nvml_found = bool(nvidia_smi_path) and subprocess.run(
+                        [nvidia_smi_path], stdout=subprocess.PIPE, stderr=subprocess.PIPE).returncode == 0
+                if nvml_found:
+                    gpu_type = 'NVIDIA'
+                    logger.info("NVIDIA GPU detected")
+                    return gpu_type
+            except FileNotFoundError:
+                pass
+
+            # Check for VA-API support (Intel/AMD)
+            if has_vaapi_support():
+                gpu_type = 'VA-API'
+                logger.info("VA-API support detected")
+                return gpu_type
+
+            # Default to software encoding
+            gpu_type = 'Software'
+            logger.info("No GPU acceleration detected, using software encoding")
+        else:
+            gpu_type = 'Software'
+            logger.info("Unsupported platform, using software encoding")
+
+    except Exception as e:
+        logger.error(f"Error detecting GPU: {str(e)}")
+        gpu_type = 'Software'
+        logger.info("Error during GPU detection, defaulting to software encoding")
+    return gpu_type
+
 class GPU:
     """
     GPU detection and encoder selection class.
@@ -79,91 +227,14 @@ class GPU:
         3. Fallback to software encoding if no hardware acceleration is found
         
         The detected GPU type is stored in self.gpu_type and logged for debugging.
+        Detection only runs once per process; see invalidate_cache().
         """
-        try:
-            if is_steam_deck():
-                # Check for VA-API support on Steam Deck (it should have it)
-                vaapi_device = has_vaapi_support()
-                if vaapi_device:
-                    self.gpu_type = 'VA-API'
-                    logger.info("Steam Deck detected with VA-API support - using hardware acceleration")
-                else:
-                    self.gpu_type = 'Software'
-                    logger.info("Steam Deck detected without VA-API support - falling back to software encoding")
-                return
-
-            if is_windows():
-                startupinfo = get_subprocess_startupinfo()
-                # Check for NVIDIA GPU using nvidia-smi
-                try:
-                    # First check if nvidia-smi exists
-                    nvidia_smi_path = shutil.which('nvidia-smi')
-                    if nvidia_smi_path:
-                        nvidia_smi = subprocess.run(
-                            [nvidia_smi_path], 
-                            stdout=subprocess.PIPE, 
-                            stderr=subprocess.PIPE, 
-                            startupinfo=startupinfo,
-                            creationflags=subprocess.CREATE_NO_WINDOW
-                        )
-                        if nvidia_smi.returncode == 0:
-                            self.gpu_type = 'NVIDIA'
-                            logger.info("NVIDIA GPU detected")
-                            return
-                except FileNotFoundError:
-                    pass
-                except Exception as e:
-                    logger.warning(f"Error checking for NVIDIA GPU: {str(e)}")
-
-                # Check for AMD GPU using PowerShell
-                try:
-                    ps_cmd = "Get-WmiObject Win32_VideoController | Select-Object Name"
-                    amd_check = subprocess.run(
-                        ['powershell', '-Command', ps_cmd], 
-                        stdout=subprocess.PIPE, 
-                        stderr=subprocess.PIPE,
-                        startupinfo=startupinfo,
-                        creationflags=subprocess.CREATE_NO_WINDOW
-                    )
-                    if amd_check.returncode == 0 and b'AMD' in amd_check.stdout.upper():
-                        self.gpu_type = 'AMD'
-                        logger.info("AMD GPU detected")
-                        return
-                except Exception as e:
-                    logger.warning(f"Error checking for AMD GPU: {str(e)}")
-
-                # Default to Intel/Software
-                self.gpu_type = 'Software'
-                logger.info("No dedicated GPU detected, using software encoding")
-
-            elif is_linux():
-                # Check for NVIDIA GPU
-                try:
-                    nvidia_smi = subprocess.run(['nvidia-smi'], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                    if nvidia_smi.returncode == 0:
-                        self.gpu_type = 'NVIDIA'
-                        logger.info("NVIDIA GPU detected")
-                        return
-                except FileNotFoundError:
-                    pass
-
-                # Check for VA-API support (Intel/AMD)
-                if has_vaapi_support():
-                    self.gpu_type = 'VA-API'
-                    logger.info("VA-API support detected")
-                    return
-
-                # Default to software encoding
-                self.gpu_type = 'Software'
-                logger.info("No GPU acceleration detected, using software encoding")
-            else:
-                self.gpu_type = 'Software'
-                logger.info("Unsupported platform, using software encoding")
+        self.gpu_type = _detect_gpu_type()
 
-        except Exception as e:
-            logger.error(f"Error detecting GPU: {str(e)}")
-            self.gpu_type = 'Software'
-            logger.info("Error during GPU detection, defaulting to software encoding")
+    @classmethod
+    def invalidate_cache(cls):
+        """Forget the cached detection result so the next detect_gpu() probes again."""
+        _detect_gpu_type.cache_clear()
 
     def get_recommended_encoder(self):
         """
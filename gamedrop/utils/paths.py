@@ -19,8 +19,14 @@ The module automatically adjusts paths based on:
 import os
 import sys
 import platform
+import functools
 
+# Neither the platform nor the runtime environment changes while running
+_SYSTEM = platform.system()
+_FROZEN = getattr(sys, 'frozen', False)
 
+
+@functools.lru_cache(maxsize=1)
 def get_app_root():
     """
     Get the application's root directory based on the runtime environment.
@@ -33,7 +39,7 @@ def get_app_root():
     In development mode:
         Returns the 'gamedrop' package directory.
     """
-    if getattr(sys, 'frozen', False):
+    if _FROZEN:
         # Running as a PyInstaller bundle - use executable's directory
         return os.path.dirname(sys.executable)
     else:
@@ -41,6 +47,7 @@ def get_app_root():
         return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
+@functools.lru_cache(maxsize=1)
 def get_logs_directory():
     """
     Get the path to the logs directory, creating it if necessary.
@@ -52,11 +59,13 @@ def get_logs_directory():
     
     Returns:
         str: The absolute path to the logs directory
+    
+    The path is resolved (and the directory created) once per process.
     """
-    if platform.system() == "Linux":
+    if _SYSTEM == "Linux":
         # Use standard Linux config directory
         logs_dir = os.path.join(os.path.expanduser("~"), '.config', 'gamedrop', 'logs')
-    elif platform.system() == "Windows":
+    elif _SYSTEM == "Windows":
         # Use AppData for Windows (both bundled and development)
         logs_dir = os.path.join(os.getenv('APPDATA'), 'GameDrop', 'Logs')
     else:
@@ -133,6 +142,7 @@ def ensure_directory_exists(directory_path):
     return directory_path
 
 
+@functools.lru_cache(maxsize=1)
 def get_ffmpeg_directory():
     """
     Get the directory where FFmpeg binaries should be stored.
@@ -147,15 +157,16 @@ def get_ffmpeg_directory():
         str: The absolute path to the FFmpeg binaries directory
         
     Note:
-        The directory will be created if it doesn't exist
+        The directory will be created if it doesn't exist; the path is
+        resolved once per process
         Different paths are used to respect each OS's conventions
     """
-    if platform.system() == "Linux":
+    if _SYSTEM == "Linux":
         # Use standard Linux config directory for FFmpeg as well
         ffmpeg_dir = os.path.join(os.path.expanduser("~"), '.config', 'GameDrop', 'ffmpeg')
-    elif getattr(sys, 'frozen', False):
+    elif _FROZEN:
         # Use AppData for installed application on Windows
-        if platform.system() == "Windows":
+        if _SYSTEM == "Windows":
             ffmpeg_dir = os.path.join(os.getenv('APPDATA'), 'GameDrop', 'ffmpeg')
         else: # Fallback for other frozen OS
             ffmpeg_dir = os.path.join(get_app_root(), 'ffmpeg_bin') # Store alongside executable
@@ -182,10 +193,8 @@ def get_webhooks_path():
         Different locations are used to ensure file persistence
         across application updates and to follow OS conventions
     """
-    import platform
-    
     # On Windows, store webhooks.json in AppData for consistency with logs and FFmpeg
-    if platform.system() == "Windows":
+    if _SYSTEM == "Windows":
         webhook_dir = os.path.join(os.getenv('APPDATA'), 'GameDrop')
         ensure_directory_exists(webhook_dir)
         return os.path.join(webhook_dir, 'webhooks.json')